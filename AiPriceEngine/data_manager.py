@@ -260,6 +260,26 @@ _MANDI_RESOURCE = (
 _logger = logging.getLogger("agrostack.data_manager")
 
 
+async def _get_json(
+    client: Optional[httpx.AsyncClient],
+    url: str,
+    params: Dict[str, Any],
+    timeout: float,
+) -> Any:
+    """GET *url* and decode the JSON body.
+
+    Reuses *client* (and its keep-alive connection pool) when one has been
+    injected; otherwise falls back to a short-lived client for this call.
+    """
+    if client is not None:
+        resp = await client.get(url, params=params, timeout=timeout)
+    else:
+        async with httpx.AsyncClient(timeout=timeout) as tmp_client:
+            resp = await tmp_client.get(url, params=params)
+    resp.raise_for_status()
+    return resp.json()
+
+
 class LivePriceInformer:
     """Async fetcher for Kerala mandi prices from Data.gov.in.
 
@@ -272,10 +292,18 @@ class LivePriceInformer:
 
     The fetcher hardcodes ``filters[state.keyword]=Kerala`` and title-cases
     the commodity name to match Agmarknet conventions.
+
+    Assign a long-lived ``httpx.AsyncClient`` to ``client`` to reuse pooled
+    keep-alive connections across calls.
     """
 
-    def __init__(self, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.timeout = timeout
+        self.client = client
 
     async def fetch(self, crop_id: str, limit: int = 100) -> Dict[str, Any]:
         """Fetch live Kerala mandi records for *crop_id*.
@@ -323,14 +351,11 @@ class LivePriceInformer:
             "limit": limit,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.get(_MANDI_RESOURCE, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-            except (httpx.HTTPError, ValueError) as exc:
-                _logger.error("Mandi API error: %s", exc)
-                return empty
+        try:
+            data = await _get_json(self.client, _MANDI_RESOURCE, params, self.timeout)
+        except (httpx.HTTPError, ValueError) as exc:
+            _logger.error("Mandi API error: %s", exc)
+            return empty
 
         raw_records = data.get("records", [])
         if not raw_records:
@@ -393,11 +418,17 @@ class WeatherClient:
     """Async weather fetcher from Open-Meteo for Kottayam, Kerala.
 
     Fetches current conditions and a 24-hour rainfall total for
-    waterlogging / biological risk assessment.
+    waterlogging / biological risk assessment. Like ``LivePriceInformer``,
+    an injected ``client`` is reused across calls.
     """
 
-    def __init__(self, timeout: float = 15.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.timeout = timeout
+        self.client = client
 
     async def fetch(
         self,
@@ -434,14 +465,11 @@ class WeatherClient:
             "timezone": "Asia/Kolkata",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.get(_OPENMETEO_CURRENT, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-            except (httpx.HTTPError, ValueError) as exc:
-                _logger.error("Open-Meteo error: %s", exc)
-                return defaults
+        try:
+            data = await _get_json(self.client, _OPENMETEO_CURRENT, params, self.timeout)
+        except (httpx.HTTPError, ValueError) as exc:
+            _logger.error("Open-Meteo error: %s", exc)
+            return defaults
 
         # Current conditions
         current = data.get("current", {})
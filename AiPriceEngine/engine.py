@@ -430,11 +430,39 @@ class HybridPredictor:
 
     # Live-price prediction
 
+    def get_prophet_forecast(self, crop_id: str, periods: int = 30) -> float:
+        """Return the Prophet trend value used by ``predict_hybrid``.
+
+        The forecast only changes when the model is retrained, so callers
+        may memoise the result (e.g. per crop per day) and pass it back
+        through ``predict_hybrid(prophet_trend=...)``.
+
+        Parameters
+        ----------
+        crop_id : str
+            Crop identifier (used for labelling / cache keys; the
+            underlying model is shared for the demo).
+        periods : int
+            Forecast horizon in days.
+
+        Returns
+        -------
+        float
+        """
+        if not self._trained or self.data is None:
+            raise RuntimeError("HybridPredictor has not been trained.")
+
+        try:
+            return self.seasonality.get_trend_value(periods=periods)
+        except Exception:
+            return float(self.data["y"].iloc[-1])
+
     def predict_hybrid(
         self,
         crop_id: str,
         current_price: float,
         advisory_bias: float = 1.0,
+        prophet_trend: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Produce a 30-day forecast anchored to a *live* current price.
 
@@ -451,6 +479,9 @@ class HybridPredictor:
             Live Kerala avg modal price from ``LivePriceInformer``.
         advisory_bias : float
             Multiplicative bias from ``AgronomicAdvisoryLayer`` (default 1.0).
+        prophet_trend : float, optional
+            Pre-computed ``get_prophet_forecast`` value. If *None*, Prophet
+            is evaluated on this call.
 
         Returns
         -------
@@ -463,10 +494,8 @@ class HybridPredictor:
         last_known = float(self.data["y"].iloc[-1])
 
         # Prophet trend
-        try:
-            prophet_trend = self.seasonality.get_trend_value(periods=30)
-        except Exception:
-            prophet_trend = last_known
+        if prophet_trend is None:
+            prophet_trend = self.get_prophet_forecast(crop_id, periods=30)
 
         # LSTM correction
         try:
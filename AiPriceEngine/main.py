@@ -16,31 +16,39 @@ GET /public-key
 Run
 ---
     uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+
+  Production (libuv event loop + C HTTP parser):
+    uvicorn main:app --loop uvloop --http httptools --host 0.0.0.0 --port 8000
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import datetime as dt
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.asymmetric import rsa, padding, utils
 from cryptography.hazmat.primitives import hashes, serialization
 
 from engine import HybridPredictor, AgronomicAdvisoryLayer
 from data_manager import LivePriceInformer, WeatherClient
-from simulation_engine import create_simulation_router
+from simulation_engine import close_http_client, create_simulation_router
 from federatedlearning import FederatedPricePredictor, SUPPORTED_CROPS, REGIONS
 
 logger = logging.getLogger("agrostack")
@@ -53,6 +61,107 @@ class RecommendRequest(BaseModel):
     crop: str
     current_price: float
     current_location: str
+
+
+# ── Pydantic Response Models ─────────────────────────────────────────────────
+# Typed responses let FastAPI serialise through pydantic-core instead of
+# walking unknown dicts with ``jsonable_encoder``. /predict returns its
+# signed bytes as a raw Response, so PredictResponse there only declares
+# the OpenAPI schema of that body.
+
+class AdvisoryInfo(BaseModel):
+    """Agronomic advisory outcome embedded in a prediction."""
+    triggered: bool
+    insight: str
+    rule_used: str
+    metric_value: Optional[float] = None
+    bias: float
+
+
+class Attribution(BaseModel):
+    """XAI attribution metadata for a prediction."""
+    prophet_weight: float
+    lstm_weight: float
+    shock_factor: float
+    seasonal_contribution: float
+    anomaly_detected: str
+    data_source: str
+
+
+class WeatherSnapshot(BaseModel):
+    """Live weather conditions from ``WeatherClient.fetch()``."""
+    temp: float
+    humidity: float
+    precip: float
+    rain: float
+    wind_speed: float
+    rain_24h: float
+
+
+class MarketSummary(BaseModel):
+    """Aggregated Kerala mandi statistics."""
+    avg_modal: float
+    min_price: float
+    max_price: float
+    record_count: int
+    markets: List[str]
+    districts: List[str]
+
+
+class PredictResponse(BaseModel):
+    """Signed payload returned by ``GET /predict/{crop_id}``."""
+    crop_id: str
+    crop_name: str
+    state: str
+    district: str
+    current_price: float
+    predicted_price: float
+    bias_applied: float
+    biological_risk_alert: bool
+    advisory: AdvisoryInfo
+    prophet_trend: float
+    prophet_multiplier: float
+    lstm_correction: float
+    lstm_multiplier: float
+    prophet_weight: float
+    lstm_weight: float
+    insights: str
+    attribution: Attribution
+    weather_snapshot: WeatherSnapshot
+    market_summary: MarketSummary
+    source_timestamp: str
+    signature: str
+
+
+class ModelWeights(BaseModel):
+    """Fusion weights of the hybrid model."""
+    prophet: float
+    lstm: float
+
+
+class AnalyticsResponse(BaseModel):
+    """Model analytics returned by ``GET /analytics``."""
+    confidence_score: float
+    shock_alert: bool
+    deviation_percent: float
+    prophet_trend: float
+    lstm_correction: float
+    data_points_used: int
+    lstm_window_days: int
+    model_weights: ModelWeights
+    timestamp: str
+
+
+def canonical_json(payload: Dict[str, Any]) -> bytes:
+    """Encode *payload* into the canonical bytes we sign.
+
+    The form is ``json.dumps(payload, sort_keys=True, default=str)`` --
+    keys sorted at every level, ``", "`` / ``": "`` separators, ASCII
+    escapes -- and must stay byte-identical for existing verifiers.
+    """
+    return json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+
+
 logging.basicConfig(level=logging.INFO)
 
 # RSA Digital Signature Utility
@@ -66,30 +175,38 @@ class RSASigner:
             key_size=key_size,
         )
         self.public_key = self.private_key.public_key()
+        # Padding / hash descriptors are immutable — build once, reuse per call
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH,
+        )
+        self._hash_algo = utils.Prehashed(hashes.SHA256())
 
     def sign(self, payload: Dict[str, Any]) -> str:
-        canonical = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
-        signature = self.private_key.sign(
-            canonical,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
+        return self.sign_bytes(canonical_json(payload))
+
+    def sign_bytes(self, canonical: bytes) -> str:
+        """Sign already-canonicalised payload bytes."""
+        return self.sign_digest(hashlib.sha256(canonical).digest())
+
+    def sign_digest(self, digest: bytes) -> str:
+        """Sign a pre-computed SHA-256 *digest* of the canonical payload.
+
+        The signature is identical to signing the payload itself, so
+        verifiers are unaffected; callers can hash (or cache the hash)
+        outside the RSA operation.
+        """
+        signature = self.private_key.sign(digest, self._pss, self._hash_algo)
         return signature.hex()
 
     def verify(self, payload: Dict[str, Any], signature_hex: str) -> bool:
-        canonical = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        canonical = canonical_json(payload)
         try:
             self.public_key.verify(
                 bytes.fromhex(signature_hex),
-                canonical,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
+                hashlib.sha256(canonical).digest(),
+                self._pss,
+                self._hash_algo,
             )
             return True
         except Exception:
@@ -111,6 +228,20 @@ weather_client: WeatherClient = WeatherClient()
 advisor: AgronomicAdvisoryLayer = AgronomicAdvisoryLayer()
 fed_predictor: FederatedPricePredictor = FederatedPricePredictor()
 
+# Prophet forecasts only move when the model is retrained — memoise per
+# (crop_id, UTC date) so /predict skips Prophet on the hot path.
+_prophet_cache: TTLCache = TTLCache(maxsize=64, ttl=86400)
+
+
+def get_prophet_forecast(crop_id: str) -> float:
+    """Return the (daily memoised) Prophet trend for *crop_id*."""
+    key = (crop_id, dt.datetime.utcnow().date())
+    trend = _prophet_cache.get(key)
+    if trend is None:
+        trend = predictor.get_prophet_forecast(crop_id)
+        _prophet_cache[key] = trend
+    return trend
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -121,12 +252,34 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️  DATA_GOV_API_KEY not set — live data unavailable.")
 
+    # One pooled keep-alive client shared by the mandi + weather fetchers
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=60.0,
+        ),
+    )
+    live_informer.client = http_client
+    weather_client.client = http_client
+
     logger.info("⏳ Training Hybrid AI Price Engine (Prophet + LSTM) …")
     predictor.train(lstm_epochs=10)
+    _prophet_cache.clear()
     logger.info("✅ Model training complete — API is ready.")
     logger.info("🔑 RSA-2048 key-pair generated (in-memory).")
+    # The key never changes after init — serialise /public-key once
+    app.state.public_key_body = orjson.dumps({
+        "algorithm": "RSA-PSS / SHA-256",
+        "key_format": "PEM",
+        "public_key": signer.export_public_key_pem(),
+    })
     logger.info("🌿 Agronomic Advisory Layer active (25 crops).")
     yield
+    live_informer.client = None
+    weather_client.client = None
+    await http_client.aclose()
+    await close_http_client()
     logger.info("🛑 Shutting down AgroStack API.")
 
 # FastAPI
@@ -141,6 +294,8 @@ app = FastAPI(
     ),
     version="3.0.0",
     lifespan=lifespan,
+    # Every endpoint returns plain Python types — serialise them with orjson
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -170,7 +325,11 @@ async def root():
     }
 
 
-@app.get("/predict/{crop_id}", tags=["Prediction"])
+@app.get(
+    "/predict/{crop_id}",
+    tags=["Prediction"],
+    response_model=PredictResponse,
+)
 async def predict(
     crop_id: str,
     lat: Optional[float] = Query(None, description="Latitude (default: Kottayam 9.5916)"),
@@ -214,7 +373,7 @@ async def predict(
 
     # 2. No mandi records → clear JSON error
     if market_data["record_count"] == 0:
-        return {
+        return ORJSONResponse({
             "error": True,
             "message": f"No active Mandi records for {crop_name} in Kerala today.",
             "crop_id": crop_id.lower(),
@@ -223,7 +382,7 @@ async def predict(
             "weather_snapshot": weather,
             "source": "data.gov.in",
             "source_timestamp": dt.datetime.utcnow().isoformat() + "Z",
-        }
+        })
 
     current_price = market_data["avg_modal"]
 
@@ -236,6 +395,7 @@ async def predict(
             crop_id=crop_id.lower(),
             current_price=current_price,
             advisory_bias=advisory["bias"],
+            prophet_trend=get_prophet_forecast(crop_id.lower()),
         )
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
@@ -289,16 +449,23 @@ async def predict(
         "source_timestamp": source_timestamp,
     }
 
-    # 6. RSA-PSS sign (covers insights, bias_applied, advisory)
-    signature = signer.sign(payload)
+    # 6. RSA-PSS sign the canonical bytes (covers insights, bias_applied, advisory)
+    canonical = canonical_json(payload)
+    signature = signer.sign_bytes(canonical)
 
-    return {
-        **payload,
-        "signature": signature,
-    }
+    # Splice the signature into the already-encoded object — no re-encode
+    return Response(
+        content=canonical[:-1] + b', "signature": "' + signature.encode("ascii") + b'"}',
+        media_type="application/json",
+    )
 
 
-@app.get("/analytics", tags=["Analytics"])
+@app.get(
+    "/analytics",
+    tags=["Analytics"],
+    response_model=AnalyticsResponse,
+    response_class=ORJSONResponse,
+)
 async def analytics():
     """Return model analytics: confidence score, shock alerts, and metadata."""
     try:
@@ -306,20 +473,19 @@ async def analytics():
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc))
 
-    return {
+    return AnalyticsResponse(
         **result,
-        "timestamp": dt.datetime.utcnow().isoformat() + "Z",
-    }
+        timestamp=dt.datetime.utcnow().isoformat() + "Z",
+    )
 
 
 @app.get("/public-key", tags=["Security"])
 async def public_key():
     """Export the RSA public key (PEM) for signature verification."""
-    return {
-        "algorithm": "RSA-PSS / SHA-256",
-        "key_format": "PEM",
-        "public_key": signer.export_public_key_pem(),
-    }
+    return Response(
+        content=app.state.public_key_body,
+        media_type="application/json",
+    )
 
 
 @app.get("/federated/{crop_id}", tags=["Federated Learning"])
@@ -1,10 +1,11 @@
 """
 sarvamXsupa.py -- MCP-compatible JSON-RPC 2.0 Server for AgroStack Inventory
 =============================================================================
-Exposes exactly two tools via a POST /mcp endpoint:
+Exposes three tools via a POST /mcp endpoint (plus GET /health):
 
-  1) push_to_inventory  -- Insert a new inventory record
-  2) pull_from_inventory -- Fetch inventory records (latest first)
+  1) push_to_inventory       -- Insert a new inventory record
+  2) push_many_to_inventory  -- Bulk-insert inventory records in one roundtrip
+  3) pull_from_inventory     -- Fetch inventory records (latest first)
 
 Security:
   - Hardcoded table name (no dynamic SQL)
@@ -16,23 +17,35 @@ Protocol:
   - Supports: initialize, tools/list, tools/call
 
 Run standalone:
-  uvicorn AiPriceEngine.sarvamXsupa:app --host 0.0.0.0 --port 9090
+  uvicorn AiPriceEngine.sarvamXsupa:app --loop uvloop --http httptools \
+      --workers $(nproc) --host 0.0.0.0 --port 9090
+
+  Each worker runs its own lifespan and therefore its own DB pool, so keep
+  workers x DB_MAX below Postgres ``max_connections`` (or front Postgres
+  with pgbouncer in transaction mode and set DB_STATEMENT_CACHE_SIZE=0).
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import datetime as dt
+import hashlib
 import logging
+import operator
 import os
+import re
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import asyncpg
 import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-from psycopg2 import pool as pg_pool
-from psycopg2.extras import RealDictCursor
 from pydantic import BaseModel
 
 load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
@@ -48,27 +61,76 @@ DATABASE_URL: str = os.getenv("DATABASE_URL", "").strip('"')
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in environment / .env")
 
-_connection_pool: Optional[pg_pool.SimpleConnectionPool] = None
+_connection_pool: Optional[asyncpg.Pool] = None
+
+# Pool sizing (per worker -- the aggregate across uvicorn workers is
+# workers x DB_MAX). create_pool opens min_size connections up front, so
+# first requests do not pay the TCP/TLS/auth handshake.
+_POOL_MIN_SIZE: int = int(os.getenv("DB_MIN", "4"))
+_POOL_MAX_SIZE: int = int(os.getenv("DB_MAX", "32"))
+# Seconds a tool call may wait for a free connection before failing fast.
+_POOL_ACQUIRE_TIMEOUT = 10.0
+
+# Prepared statements cached per connection (0 disables -- needed behind
+# pgbouncer in transaction-pooling mode).
+_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
 
+async def _get_pool() -> asyncpg.Pool:
+    """Lazily initialise and return the asyncpg connection pool.
 
-def _get_pool() -> pg_pool.SimpleConnectionPool:
-    """Lazily initialise and return the psycopg2 connection pool."""
+    asyncpg is fully async, so DB I/O never blocks the event loop. Each
+    connection keeps an LRU of server-side prepared statements keyed by
+    query text, so the module-level SQL constants below are parsed and
+    planned once per connection and then only re-executed.
+    """
     global _connection_pool
-    if _connection_pool is None or _connection_pool.closed:
-        _connection_pool = pg_pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
+    if _connection_pool is None or _connection_pool.is_closing():
+        _connection_pool = await asyncpg.create_pool(
             dsn=DATABASE_URL,
+            min_size=_POOL_MIN_SIZE,
+            max_size=_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=300.0,
+            statement_cache_size=_STATEMENT_CACHE_SIZE,
+        )
+        logger.info(
+            "Database connection pool created (min=%d, max=%d).",
+            _POOL_MIN_SIZE, _POOL_MAX_SIZE,
         )
-        logger.info("Database connection pool created.")
     return _connection_pool
 
 
-def _shutdown_pool() -> None:
+async def _ensure_indexes() -> None:
+    """Create the index backing pull_from_inventory and log its plan.
+
+    ``ORDER BY "addedAt" DESC LIMIT n`` becomes an index-only range scan
+    (the INCLUDE columns make it covering) instead of a full sort.
+    Failures (e.g. missing privileges) are logged, not fatal.
+    """
+    pool = await _get_pool()
+    try:
+        async with pool.acquire(timeout=_POOL_ACQUIRE_TIMEOUT) as conn:
+            await conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_inventory_addedat_desc '
+                'ON inventory ("addedAt" DESC) '
+                'INCLUDE (id, "cropName", quantity, unit, "marketPrice", "isProfitable")'
+            )
+            plan = await conn.fetch(
+                "EXPLAIN (ANALYZE, BUFFERS) " + _SELECT_SQL, 10
+            )
+    except (asyncpg.PostgresError, OSError, asyncio.TimeoutError) as exc:
+        logger.warning("Could not ensure inventory indexes: %s", exc)
+        return
+    logger.info(
+        "pull_from_inventory plan:\n%s", "\n".join(r[0] for r in plan)
+    )
+
+
+async def _shutdown_pool() -> None:
     """Close all connections in the pool."""
     global _connection_pool
-    if _connection_pool is not None and not _connection_pool.closed:
-        _connection_pool.closeall()
+    if _connection_pool is not None and not _connection_pool.is_closing():
+        await _connection_pool.close()
         _connection_pool = None
         logger.info("Database connection pool closed.")
 
@@ -103,9 +165,27 @@ TOOL_PUSH = {
     },
 }
 
+TOOL_PUSH_MANY = {
+    "name": "push_many_to_inventory",
+    "description": "Insert many inventory items in a single batch",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "rows": {
+                "type": "array",
+                "items": TOOL_PUSH["inputSchema"],
+            },
+        },
+        "required": ["rows"],
+    },
+}
+
 TOOL_PULL = {
     "name": "pull_from_inventory",
-    "description": "Fetch inventory records",
+    "description": (
+        "Fetch recent inventory records, returned column-wise as "
+        "{columns: [...], rows: [[...], ...]}"
+    ),
     "inputSchema": {
         "type": "object",
         "properties": {
@@ -114,93 +194,307 @@ TOOL_PULL = {
     },
 }
 
-TOOLS: List[dict] = [TOOL_PUSH, TOOL_PULL]
+TOOLS: List[dict] = [TOOL_PUSH, TOOL_PUSH_MANY, TOOL_PULL]
 
 # ---------------------------------------------------------------------------
 # Tool Implementations
 # ---------------------------------------------------------------------------
 
-_PUSH_REQUIRED_FIELDS = [
+# Column order is the single source of truth for the SQL text, the COPY
+# column list and the itemgetter below; addedAt must stay last.
+_INVENTORY_COLUMNS = (
     "id", "cropName", "quantity", "unit",
     "marketPrice", "isProfitable", "addedAt",
-]
+)
+_PUSH_REQUIRED_SET = frozenset(_INVENTORY_COLUMNS)
+# Pulls the row values out of a params dict in column order, in one C call.
+_push_values = operator.itemgetter(*_INVENTORY_COLUMNS)
+
+# Statement text is built once at import from the constants above (never
+# from request input), so every call sends byte-identical SQL.
+_COLUMN_LIST = ", ".join(f'"{c}"' for c in _INVENTORY_COLUMNS)
+
+_INSERT_SQL = (
+    f"INSERT INTO inventory ({_COLUMN_LIST}) VALUES ("
+    + ", ".join(f"${i}" for i in range(1, len(_INVENTORY_COLUMNS) + 1))
+    + ")"
+)
+
+_SELECT_SQL = (
+    f"SELECT {_COLUMN_LIST} FROM inventory "
+    'ORDER BY "addedAt" DESC LIMIT $1'
+)
+
+# Batches at least this large go through binary COPY instead of executemany.
+_COPY_THRESHOLD = 500
+
+# pull_from_inventory returns rows column-wise: one shared column list plus
+# a tuple per row, instead of a 7-key dict per row.
+_PULL_COLUMNS: List[str] = list(_INVENTORY_COLUMNS)
+_CROP_NAME_IDX = _INVENTORY_COLUMNS.index("cropName")
+_QUANTITY_IDX = _INVENTORY_COLUMNS.index("quantity")
+_UNIT_IDX = _INVENTORY_COLUMNS.index("unit")
+
+# pull_from_inventory result cache: limit -> (version, stored_at, result).
+# Entries expire after _PULL_CACHE_TTL seconds, and every successful push
+# bumps _PULL_CACHE_VERSION so stale rows are never served.
+_PULL_CACHE_TTL = 5.0
+_PULL_CACHE: Dict[int, tuple[int, float, Dict[str, Any]]] = {}
+_PULL_CACHE_VERSION = 0
+_pull_cache_hits = 0
+
+
+def _invalidate_pull_cache() -> None:
+    """Drop cached pull results after the inventory table changes."""
+    global _PULL_CACHE_VERSION
+    _PULL_CACHE_VERSION += 1
+    _PULL_CACHE.clear()
+
+
+def _parse_timestamp(value: Any) -> Any:
+    """Coerce an ISO-8601 string to ``datetime`` (a trailing ``Z`` means UTC)."""
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        return dt.datetime.fromisoformat(text)
+    return value
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_int(value: Any) -> int:
+    return int(value.strip()) if isinstance(value, str) else int(value)
+
+
+def _to_numeric(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value.strip() if isinstance(value, str) else str(value))
+
+
+def _to_float(value: Any) -> float:
+    return float(value)
+
+
+_TRUE_STRINGS = frozenset(("t", "true", "y", "yes", "on", "1"))
+_FALSE_STRINGS = frozenset(("f", "false", "n", "no", "off", "0"))
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"invalid boolean value: {value!r}")
+    return bool(value)
+
+
+def _to_timestamp(value: Any) -> dt.datetime:
+    """``timestamp`` columns take naive datetimes: convert aware ones to UTC."""
+    value = _parse_timestamp(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return value
+
 
+def _to_timestamptz(value: Any) -> dt.datetime:
+    """``timestamptz`` columns: naive datetimes are taken to be UTC."""
+    value = _parse_timestamp(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt.timezone.utc)
+    return value
 
-def _push_to_inventory(params: Dict[str, Any]) -> Dict[str, Any]:
+
+def _to_date(value: Any) -> dt.date:
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return _parse_timestamp(value).date()
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# asyncpg binds strictly by parameter type (a str is rejected for numeric, an
+# aware datetime for timestamp, ...), whereas psycopg2 let the server coerce
+# literals. Values are therefore converted to the column's type in Python,
+# which also covers the COPY path where SQL casts are not available.
+_TYPE_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "text": _to_text,
+    "varchar": _to_text,
+    "bpchar": _to_text,
+    "int2": _to_int,
+    "int4": _to_int,
+    "int8": _to_int,
+    "numeric": _to_numeric,
+    "float4": _to_float,
+    "float8": _to_float,
+    "bool": _to_bool,
+    "timestamp": _to_timestamp,
+    "timestamptz": _to_timestamptz,
+    "date": _to_date,
+}
+
+# One converter per _INVENTORY_COLUMNS entry, read from the INSERT
+# statement's parameter types on first use.
+_row_converters: Optional[tuple[Callable[[Any], Any], ...]] = None
+
+
+def _converters_for(type_names: tuple[str, ...]) -> tuple[Callable[[Any], Any], ...]:
+    """Map Postgres type names to value converters (unknown types pass through)."""
+    return tuple(_TYPE_CONVERTERS.get(name, _identity) for name in type_names)
+
+
+async def _get_row_converters(conn: asyncpg.Connection) -> tuple[Callable[[Any], Any], ...]:
+    """Return the per-column converters, introspecting the table once."""
+    global _row_converters
+    if _row_converters is None:
+        stmt = await conn.prepare(_INSERT_SQL)
+        _row_converters = _converters_for(
+            tuple(t.name for t in stmt.get_parameters())
+        )
+    return _row_converters
+
+
+def _row_values(
+    row: Dict[str, Any], converters: tuple[Callable[[Any], Any], ...]
+) -> tuple:
+    """Return *row*'s INSERT arguments in ``_INVENTORY_COLUMNS`` order,
+    converted to the column types so asyncpg can bind them."""
+    try:
+        return tuple(
+            None if value is None else convert(value)
+            for convert, value in zip(converters, _push_values(row))
+        )
+    except (ArithmeticError, AttributeError, TypeError) as exc:
+        raise ValueError(f"Invalid inventory value: {exc}") from exc
+
+
+async def _push_to_inventory(params: Dict[str, Any]) -> Dict[str, Any]:
     """Insert a single row into the *inventory* table.
 
     Uses a parameterised INSERT -- no dynamic SQL, no table-name input.
     """
-    missing = [f for f in _PUSH_REQUIRED_FIELDS if f not in params]
+    missing = _PUSH_REQUIRED_SET - params.keys()
     if missing:
-        raise ValueError(f"Missing required fields: {missing}")
+        raise ValueError(f"Missing required fields: {sorted(missing)}")
 
-    pool = _get_pool()
-    conn = pool.getconn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO inventory
-                    (id, "cropName", quantity, unit, "marketPrice", "isProfitable", "addedAt")
-                VALUES
-                    (%(id)s, %(cropName)s, %(quantity)s, %(unit)s,
-                     %(marketPrice)s, %(isProfitable)s, %(addedAt)s)
-                """,
-                {
-                    "id": params["id"],
-                    "cropName": params["cropName"],
-                    "quantity": params["quantity"],
-                    "unit": params["unit"],
-                    "marketPrice": params["marketPrice"],
-                    "isProfitable": params["isProfitable"],
-                    "addedAt": params["addedAt"],
-                },
+    pool = await _get_pool()
+    async with pool.acquire(timeout=_POOL_ACQUIRE_TIMEOUT) as conn:
+        converters = await _get_row_converters(conn)
+        await conn.execute(_INSERT_SQL, *_row_values(params, converters))
+    _invalidate_pull_cache()
+    logger.info("Inserted inventory row id=%s", params["id"])
+    return {"status": "success", "inserted_id": params["id"]}
+
+
+async def _push_many_to_inventory(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Insert a batch of rows into the *inventory* table in one roundtrip.
+
+    Small batches use a pipelined ``executemany``; large ones stream through
+    binary ``COPY``. Either way the batch is all-or-nothing.
+    """
+    rows = params.get("rows")
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("'rows' must be a non-empty list")
+
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise ValueError(f"Row {i}: must be an object")
+        missing = _PUSH_REQUIRED_SET - row.keys()
+        if missing:
+            raise ValueError(f"Row {i}: missing required fields: {sorted(missing)}")
+
+    pool = await _get_pool()
+    async with pool.acquire(timeout=_POOL_ACQUIRE_TIMEOUT) as conn:
+        converters = await _get_row_converters(conn)
+        records = [_row_values(row, converters) for row in rows]
+        if len(records) >= _COPY_THRESHOLD:
+            await conn.copy_records_to_table(
+                "inventory",
+                records=records,
+                columns=_INVENTORY_COLUMNS,
             )
-        conn.commit()
-        logger.info("Inserted inventory row id=%s", params["id"])
-        return {"status": "success", "inserted_id": params["id"]}
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        pool.putconn(conn)
+        else:
+            async with conn.transaction():
+                await conn.executemany(_INSERT_SQL, records)
+
+    _invalidate_pull_cache()
+    logger.info("Inserted %d inventory rows", len(records))
+    return {"status": "success", "inserted_count": len(records)}
 
 
-def _pull_from_inventory(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def _pull_from_inventory(params: Dict[str, Any]) -> Dict[str, Any]:
     """Fetch recent rows from the *inventory* table.
 
-    ORDER BY "addedAt" DESC, LIMIT capped at 100 (default 10).
+    ORDER BY "addedAt" DESC, LIMIT capped at 100 (default 10). Returns
+    ``{"columns": [...], "rows": [(...), ...]}`` and is served from
+    ``_PULL_CACHE`` for up to ``_PULL_CACHE_TTL`` seconds.
     """
+    global _pull_cache_hits
     raw_limit = params.get("limit", 10)
     limit = max(1, min(int(raw_limit), 100))
 
-    pool = _get_pool()
-    conn = pool.getconn()
-    try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT id, "cropName", quantity, unit,
-                       "marketPrice", "isProfitable", "addedAt"
-                FROM inventory
-                ORDER BY "addedAt" DESC
-                LIMIT %s
-                """,
-                (limit,),
-            )
-            rows = cur.fetchall()
-        # RealDictRow -> plain dict for JSON serialisation
-        return [dict(r) for r in rows]
-    finally:
-        pool.putconn(conn)
+    version = _PULL_CACHE_VERSION
+    cached = _PULL_CACHE.get(limit)
+    if (
+        cached is not None
+        and cached[0] == version
+        and time.monotonic() - cached[1] < _PULL_CACHE_TTL
+    ):
+        _pull_cache_hits += 1
+        return dict(cached[2])
+
+    pool = await _get_pool()
+    async with pool.acquire(timeout=_POOL_ACQUIRE_TIMEOUT) as conn:
+        rows = await conn.fetch(_SELECT_SQL, limit)
+    # asyncpg.Record -> plain tuple for JSON serialisation
+    result = {"columns": _PULL_COLUMNS, "rows": [tuple(r) for r in rows]}
+    # Tagged with the pre-query version: a push that lands mid-query
+    # invalidates this entry instead of letting it mask the new row.
+    _PULL_CACHE[limit] = (version, time.monotonic(), result)
+    return dict(result)
+
+
+# Only these tool names are valid over /mcp (the agent uses _AGENT_TOOL_NAMES).
+_TOOL_NAMES = frozenset(
+    {"push_to_inventory", "push_many_to_inventory", "pull_from_inventory"}
+)
 
 
-# Dispatch map -- only these two tool names are valid.
-_TOOL_DISPATCH: Dict[str, Any] = {
-    "push_to_inventory": _push_to_inventory,
-    "pull_from_inventory": _pull_from_inventory,
-}
+async def _call_tool(tool_name: str, tool_args: Dict[str, Any]) -> Any:
+    """Run a tool by name; callers check ``_TOOL_NAMES`` (or
+    ``_AGENT_TOOL_NAMES``) first.
+
+    The tool set is fixed, so a literal ``match`` replaces the former
+    dict-lookup dispatch table.
+    """
+    match tool_name:
+        case "push_to_inventory":
+            return await _push_to_inventory(tool_args)
+        case "push_many_to_inventory":
+            return await _push_many_to_inventory(tool_args)
+        case "pull_from_inventory":
+            return await _pull_from_inventory(tool_args)
+        case _:
+            raise ValueError(f"Unknown tool: {tool_name}")
+
+
+# Concurrency caps: /agent is sized below Sarvam's allowed concurrency, and
+# the two caps split the pool between them (for DB_MAX >= 2), so /mcp cannot
+# hold the connections /agent's tool calls need, and vice versa.
+_AGENT_CONCURRENCY = min(16, max(1, _POOL_MAX_SIZE // 2))
+_AGENT_SEM = asyncio.Semaphore(_AGENT_CONCURRENCY)
+_MCP_SEM = asyncio.Semaphore(max(1, _POOL_MAX_SIZE - _AGENT_CONCURRENCY))
 
 # ---------------------------------------------------------------------------
 # JSON-RPC 2.0 Helpers
@@ -221,12 +515,32 @@ def _jsonrpc_error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
     }
 
 
+# initialize / tools/list results never change -- serialise them once and
+# splice in the request id per call.
+_INITIALIZE_RESULT: bytes = orjson.dumps({"capabilities": {"tools": {}}})
+_TOOLS_LIST_RESULT: bytes = orjson.dumps({"tools": TOOLS})
+
+
+def _jsonrpc_ok_raw(request_id: Any, result_json: bytes) -> Response:
+    """Build a successful JSON-RPC 2.0 response around pre-encoded *result_json*."""
+    return Response(
+        content=(
+            b'{"jsonrpc":"2.0","id":' + orjson.dumps(request_id)
+            + b',"result":' + result_json + b"}"
+        ),
+        media_type="application/json",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Request Schema
 # ---------------------------------------------------------------------------
 
 class JsonRpcRequest(BaseModel):
-    """Minimal JSON-RPC 2.0 request envelope."""
+    """Minimal JSON-RPC 2.0 request envelope.
+
+    Documentation only: /mcp parses the body with orjson directly.
+    """
     jsonrpc: str = "2.0"
     id: Any = None
     method: str
@@ -237,23 +551,55 @@ class JsonRpcRequest(BaseModel):
 # FastAPI Application (standalone)
 # ---------------------------------------------------------------------------
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson (C); unknown types such as
+    ``Decimal`` fall back to ``str`` like the previous ``default=str``."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
 @asynccontextmanager
 async def _lifespan(application: FastAPI):
-    """Manage DB pool lifecycle on startup / shutdown."""
-    _get_pool()
+    """Manage DB pool and Sarvam HTTP client lifecycle on startup / shutdown."""
+    global _http_client
+    await _get_pool()
+    await _ensure_indexes()
+    _http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        headers={"Authorization": f"Bearer {SARVAM_API_KEY}"},
+    )
     yield
-    _shutdown_pool()
+    await _http_client.aclose()
+    _http_client = None
+    await _shutdown_pool()
 
 
 app = FastAPI(
     title="AgroStack MCP Server",
     version="0.1.0",
     lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
-@app.post("/mcp", response_class=JSONResponse)
-async def mcp_endpoint(req: JsonRpcRequest) -> Dict[str, Any]:
+@app.post(
+    "/mcp",
+    response_class=ORJSONResponse,
+    response_model=None,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": JsonRpcRequest.model_json_schema()},
+            },
+        },
+    },
+)
+async def mcp_endpoint(request: Request) -> Union[Dict[str, Any], Response]:
     """Single MCP endpoint handling all JSON-RPC 2.0 methods.
 
     Supported methods
@@ -261,30 +607,42 @@ async def mcp_endpoint(req: JsonRpcRequest) -> Dict[str, Any]:
     * ``initialize``  -- return server capabilities
     * ``tools/list``  -- return tool metadata
     * ``tools/call``  -- execute a tool by name
+
+    The 4-field envelope is parsed with ``orjson.loads`` and checked inline
+    rather than through a Pydantic model on every call.
     """
-    rid = req.id
-    method = req.method
-    params = req.params or {}
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _jsonrpc_error(None, -32700, "Parse error")
+    if not isinstance(data, dict):
+        return _jsonrpc_error(None, -32600, "Invalid Request")
+
+    rid = data.get("id")
+    method = data.get("method")
+    params = data.get("params") or {}
+    if not isinstance(method, str) or not isinstance(params, dict):
+        return _jsonrpc_error(rid, -32600, "Invalid Request")
 
     # ── initialize ───────────────────────────────────────────────
     if method == "initialize":
-        return _jsonrpc_ok(rid, {"capabilities": {"tools": {}}})
+        return _jsonrpc_ok_raw(rid, _INITIALIZE_RESULT)
 
     # ── tools/list ───────────────────────────────────────────────
     if method == "tools/list":
-        return _jsonrpc_ok(rid, {"tools": TOOLS})
+        return _jsonrpc_ok_raw(rid, _TOOLS_LIST_RESULT)
 
     # ── tools/call ───────────────────────────────────────────────
     if method == "tools/call":
         tool_name = params.get("name")
         tool_args = params.get("arguments", {})
 
-        handler = _TOOL_DISPATCH.get(tool_name)  # type: ignore[arg-type]
-        if handler is None:
+        if tool_name not in _TOOL_NAMES:
             return _jsonrpc_error(rid, -32601, f"Unknown tool: {tool_name}")
 
         try:
-            result = handler(tool_args)
+            async with _MCP_SEM:
+                result = await _call_tool(tool_name, tool_args)
             return _jsonrpc_ok(rid, result)
         except Exception as exc:
             logger.exception("tools/call %s failed", tool_name)
@@ -294,6 +652,17 @@ async def mcp_endpoint(req: JsonRpcRequest) -> Dict[str, Any]:
     return _jsonrpc_error(rid, -32601, f"Method not found: {method}")
 
 
+@app.get("/health")
+async def health() -> Dict[str, Any]:
+    """Liveness probe exposing backpressure and cache counters."""
+    return {
+        "status": "ok",
+        "agent_slots_free": _AGENT_SEM._value,
+        "mcp_slots_free": _MCP_SEM._value,
+        "pull_cache_hits": _pull_cache_hits,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Sarvam AI Agent — POST /agent
 # ---------------------------------------------------------------------------
@@ -303,6 +672,10 @@ SARVAM_BASE_URL: str = os.getenv(
     "SARVAM_BASE_URL", "https://api.sarvam.ai"
 ).rstrip("/")
 
+# Shared keep-alive (HTTP/2) client for Sarvam -- created in ``_lifespan`` so
+# the TCP/TLS handshake is paid once, not on every /agent call.
+_http_client: Optional[httpx.AsyncClient] = None
+
 _AGENT_SYSTEM_PROMPT = (
     "You are an AgroStack AI assistant.\n"
     "If the user wants to insert inventory data, call push_to_inventory.\n"
@@ -310,52 +683,120 @@ _AGENT_SYSTEM_PROMPT = (
     "Otherwise respond normally in English."
 )
 
-# Tool definitions formatted for Sarvam function-calling API
+# Tool definitions formatted for Sarvam function-calling API -- derived from
+# the MCP metadata so the two schemas cannot drift apart. The agent only
+# exposes single-row push and pull (see ``_AGENT_SYSTEM_PROMPT``).
 _SARVAM_TOOLS = [
     {
         "type": "function",
         "function": {
-            "name": "push_to_inventory",
-            "description": "Insert a new inventory item",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string"},
-                    "cropName": {"type": "string"},
-                    "quantity": {"type": "number"},
-                    "unit": {"type": "string"},
-                    "marketPrice": {"type": "number"},
-                    "isProfitable": {"type": "boolean"},
-                    "addedAt": {"type": "string"},
-                },
-                "required": [
-                    "id", "cropName", "quantity", "unit",
-                    "marketPrice", "isProfitable", "addedAt",
-                ],
-            },
+            "name": tool["name"],
+            "description": tool["description"],
+            "parameters": tool["inputSchema"],
         },
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "pull_from_inventory",
-            "description": "Fetch inventory records",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer"},
-                },
-            },
-        },
-    },
+    }
+    for tool in (TOOL_PUSH, TOOL_PULL)
 ]
 
+# /agent only runs the tools it advertises; a model naming any other tool
+# (e.g. push_many_to_inventory) gets "Unknown tool" instead of a bulk write.
+_AGENT_TOOL_NAMES = frozenset(t["function"]["name"] for t in _SARVAM_TOOLS)
+
+
+# LRU + TTL cache of /agent responses keyed by a digest of the user message:
+# key -> (stored_at, response). Only plain-text answers (no tool call) are
+# cached. Inventory answers are not: a push handled by another worker or
+# written by another client would leave them stale for the whole TTL.
+_AGENT_CACHE_MAX = 512
+_AGENT_CACHE_TTL = 300.0
+_AGENT_CACHE: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _agent_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a fresh cached /agent response for *key*, if any."""
+    entry = _AGENT_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at >= _AGENT_CACHE_TTL:
+        del _AGENT_CACHE[key]
+        return None
+    _AGENT_CACHE.move_to_end(key)
+    return response
+
+
+def _agent_cache_put(key: bytes, response: Dict[str, Any]) -> None:
+    """Store *response*, evicting the least recently used entry on overflow."""
+    _AGENT_CACHE[key] = (time.monotonic(), response)
+    _AGENT_CACHE.move_to_end(key)
+    if len(_AGENT_CACHE) > _AGENT_CACHE_MAX:
+        _AGENT_CACHE.popitem(last=False)
+
 
 class AgentRequest(BaseModel):
     """Incoming request body for the /agent endpoint."""
     message: str
 
 
+# Sarvam returns one consistent response shape per deployment, so each
+# helper probes the shape once and memoizes a tiny accessor for it.  An
+# accessor that stops fitting (KeyError/IndexError/TypeError) triggers a
+# single re-probe.
+_SHAPE_ERRORS = (KeyError, IndexError, TypeError)
+
+_tool_call_extractor: Optional[Callable[[Dict[str, Any]], Any]] = None
+_text_extractor: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+
+def _tool_call_from_choices(d: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    tool_calls = d["choices"][0]["message"].get("tool_calls")
+    return tool_calls[0]["function"] if tool_calls else None
+
+
+def _top_level_tool_call(d: Dict[str, Any]) -> Dict[str, Any]:
+    tool_call = d["tool_call"]
+    if not tool_call:
+        # "tool_call": null -- re-probe so choices[0] is used instead
+        raise KeyError("tool_call")
+    return tool_call
+
+
+def _probe_tool_call_shape(d: Dict[str, Any]) -> Optional[Callable]:
+    if d.get("tool_call"):
+        return _top_level_tool_call
+    if "choices" in d:
+        return _tool_call_from_choices
+    return None
+
+
+def _probe_text_shape(d: Dict[str, Any]) -> Optional[Callable]:
+    if isinstance(d.get("response"), str):
+        return operator.itemgetter("response")
+    if "choices" in d:
+        return lambda r: r["choices"][0]["message"]["content"]
+    return None
+
+
+def _apply_extractor(
+    extractor: Optional[Callable],
+    probe: Callable[[Dict[str, Any]], Optional[Callable]],
+    response_data: Dict[str, Any],
+) -> tuple[Optional[Callable], Any]:
+    """Run the memoized *extractor*, re-probing the shape once on mismatch."""
+    if extractor is not None:
+        try:
+            return extractor, extractor(response_data)
+        except _SHAPE_ERRORS:
+            pass
+    extractor = probe(response_data)
+    if extractor is None:
+        return None, None
+    try:
+        return extractor, extractor(response_data)
+    except _SHAPE_ERRORS:
+        return None, None
+
+
 def _extract_tool_call(response_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extract a tool call from Sarvam's response, if present.
 
@@ -364,51 +805,72 @@ def _extract_tool_call(response_data: Dict[str, Any]) -> Optional[Dict[str, Any]
       2) OpenAI-style ``choices[0].message.tool_calls[0]``
     Returns ``{"name": ..., "arguments": ...}`` or None.
     """
-    # Shape 1: top-level tool_call
-    tc = response_data.get("tool_call")
-    if tc and isinstance(tc, dict) and "name" in tc:
-        args = tc.get("arguments", {})
-        if isinstance(args, str):
-            args = json.loads(args)
-        return {"name": tc["name"], "arguments": args}
-
-    # Shape 2: choices → message → tool_calls
-    choices = response_data.get("choices", [])
-    if choices:
-        msg = choices[0].get("message", {})
-        tool_calls = msg.get("tool_calls", [])
-        if tool_calls:
-            fn = tool_calls[0].get("function", {})
-            name = fn.get("name")
-            args = fn.get("arguments", {})
-            if isinstance(args, str):
-                args = json.loads(args)
-            if name:
-                return {"name": name, "arguments": args}
-
-    return None
+    global _tool_call_extractor
+    _tool_call_extractor, fn = _apply_extractor(
+        _tool_call_extractor, _probe_tool_call_shape, response_data,
+    )
+    if not isinstance(fn, dict) or not fn.get("name"):
+        return None
+    args = fn.get("arguments", {})
+    if isinstance(args, str):
+        args = orjson.loads(args)
+    return {"name": fn["name"], "arguments": args}
 
 
 def _extract_text(response_data: Dict[str, Any]) -> str:
     """Extract plain-text content from Sarvam's response."""
-    # Top-level response key
-    if "response" in response_data and isinstance(response_data["response"], str):
-        return response_data["response"]
-
-    # OpenAI-style choices
-    choices = response_data.get("choices", [])
-    if choices:
-        msg = choices[0].get("message", {})
-        content = msg.get("content")
-        if content:
-            return content
+    global _text_extractor
+    _text_extractor, content = _apply_extractor(
+        _text_extractor, _probe_text_shape, response_data,
+    )
+    if content and isinstance(content, str):
+        return content
 
     # Fallback
     return response_data.get("text", str(response_data))
 
 
+# User phrasing that asks for more than a status line -- these still go
+# through the second Sarvam call for a model-written summary.
+_LLM_SUMMARY_RE = re.compile(
+    r"(translat|summar|explain|analy[sz]|compare|insight|"
+    r"hindi|tamil|malayalam|telugu|kannada|bengali|marathi|gujarati)",
+    re.IGNORECASE,
+)
+
+
+def _format_tool_summary(
+    tool_name: str,
+    tool_result: Any,
+    user_message: str,
+) -> Optional[str]:
+    """Render a local English summary of a tool result.
+
+    Returns None when the tool is unknown or the user asked for a
+    translation / explanation, in which case Sarvam writes the summary.
+    """
+    if _LLM_SUMMARY_RE.search(user_message):
+        return None
+
+    if tool_name == "push_to_inventory":
+        return f"Added inventory row {tool_result['inserted_id']} successfully."
+
+    if tool_name == "push_many_to_inventory":
+        return f"Added {tool_result['inserted_count']} inventory rows successfully."
+
+    if tool_name == "pull_from_inventory":
+        rows = tool_result["rows"]
+        if not rows:
+            return "No inventory entries found."
+        return f"Showing {len(rows)} recent entries: " + ", ".join(
+            f"{r[_CROP_NAME_IDX]} ({r[_QUANTITY_IDX]} {r[_UNIT_IDX]})"
+            for r in rows[:10]
+        )
+
+    return None
+
+
 async def _sarvam_chat(
-    client: httpx.AsyncClient,
     messages: List[Dict[str, Any]],
     include_tools: bool = True,
 ) -> Dict[str, Any]:
@@ -423,30 +885,106 @@ async def _sarvam_chat(
     if include_tools:
         payload["tools"] = _SARVAM_TOOLS
 
-    headers = {
-        "Authorization": f"Bearer {SARVAM_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    resp = await client.post(
+    resp = await _http_client.post(
         f"{SARVAM_BASE_URL}/v1/chat/completions",
-        json=payload,
-        headers=headers,
-        timeout=30.0,
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
     )
     resp.raise_for_status()
     return resp.json()
 
 
+def _parse_complete_args(fragment: str) -> Optional[Dict[str, Any]]:
+    """Return the tool arguments once *fragment* is a complete JSON object."""
+    try:
+        args = orjson.loads(fragment)
+    except orjson.JSONDecodeError:
+        return None
+    return args if isinstance(args, dict) else None
+
+
+async def _sarvam_chat_overlapped(
+    messages: List[Dict[str, Any]],
+) -> tuple[Dict[str, Any], Optional[asyncio.Task]]:
+    """Stream the tool-enabled Sarvam call and start the tool early.
+
+    SSE deltas are accumulated; as soon as the first tool call's arguments
+    form a complete JSON object the tool is started in a background task,
+    overlapping it with the rest of the stream. Returns the reassembled
+    OpenAI-style response (so ``_extract_*`` work unchanged) and the task,
+    if one was started. A non-SSE reply is returned as-is.
+    """
+    payload: Dict[str, Any] = {
+        "model": "sarvam-m",
+        "messages": messages,
+        "tools": _SARVAM_TOOLS,
+        "stream": True,
+    }
+
+    content_parts: List[str] = []
+    arg_parts: List[str] = []
+    tool_name: Optional[str] = None
+    tool_task: Optional[asyncio.Task] = None
+
+    try:
+        async with _http_client.stream(
+            "POST",
+            f"{SARVAM_BASE_URL}/v1/chat/completions",
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        ) as resp:
+            resp.raise_for_status()
+            if not resp.headers.get("content-type", "").startswith("text/event-stream"):
+                return orjson.loads(await resp.aread()), None
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices") or ()
+                if not choices:
+                    continue
+                delta = choices[0].get("delta") or {}
+                if delta.get("content"):
+                    content_parts.append(delta["content"])
+                for tc in delta.get("tool_calls") or ():
+                    if tc.get("index", 0) != 0:
+                        continue  # single-step agent: first call only
+                    fn = tc.get("function") or {}
+                    tool_name = fn.get("name") or tool_name
+                    if fn.get("arguments"):
+                        arg_parts.append(fn["arguments"])
+                    if tool_task is None and tool_name in _AGENT_TOOL_NAMES:
+                        args = _parse_complete_args("".join(arg_parts))
+                        if args is not None:
+                            tool_task = asyncio.create_task(_call_tool(tool_name, args))
+    except BaseException:
+        # Never orphan a started tool (it may be a write) -- let it finish.
+        if tool_task is not None:
+            await asyncio.gather(tool_task, return_exceptions=True)
+        raise
+
+    message: Dict[str, Any] = {"content": "".join(content_parts) or None}
+    if tool_name:
+        message["tool_calls"] = [{
+            "function": {"name": tool_name, "arguments": "".join(arg_parts) or "{}"},
+        }]
+    return {"choices": [{"message": message}]}, tool_task
+
+
 @app.post("/agent")
 async def agent_endpoint(req: AgentRequest) -> Dict[str, Any]:
     """Sarvam AI agent with single-step MCP tool execution.
 
     Flow
     ----
-    1. Send user message + tool definitions to Sarvam.
-    2. If Sarvam returns a tool call → execute via internal dispatch.
-    3. Send tool result back to Sarvam for a final English summary.
+    1. Stream user message + tool definitions to Sarvam.
+    2. If Sarvam returns a tool call → execute via internal dispatch
+       (started mid-stream once its arguments are complete).
+    3. Summarise the tool result locally; only when the user asks for a
+       translation / explanation, send it back to Sarvam instead.
     4. Return the final response to the frontend.
     """
     if not SARVAM_API_KEY:
@@ -456,46 +994,64 @@ async def agent_endpoint(req: AgentRequest) -> Dict[str, Any]:
     if not user_message:
         return {"response": "Please provide a message.", "tool_used": None}
 
+    cache_key = hashlib.blake2b(user_message.encode(), digest_size=16).digest()
+    cached = _agent_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Bounded concurrency: excess requests queue here instead of piling
+    # onto Sarvam's rate limit and the DB pool.
+    async with _AGENT_SEM:
+        return await _agent_turn(user_message, cache_key)
+
+
+async def _agent_turn(user_message: str, cache_key: bytes) -> Dict[str, Any]:
+    """Run one Sarvam round (plus optional tool call) for *user_message*."""
     messages = [
         {"role": "system", "content": _AGENT_SYSTEM_PROMPT},
         {"role": "user", "content": user_message},
     ]
 
     try:
-        async with httpx.AsyncClient() as client:
-            # ── Step 1: First Sarvam call (with tools) ───────────
-            sarvam_resp = await _sarvam_chat(client, messages, include_tools=True)
-            tool_call = _extract_tool_call(sarvam_resp)
-
-            # ── No tool call → return plain text ─────────────────
-            if tool_call is None:
-                return {
-                    "response": _extract_text(sarvam_resp),
-                    "tool_used": None,
-                }
-
-            tool_name: str = tool_call["name"]
-            tool_args: Dict[str, Any] = tool_call["arguments"]
-
-            # ── Step 2: Execute tool via internal dispatch ───────
-            handler = _TOOL_DISPATCH.get(tool_name)
-            if handler is None:
-                return {
-                    "response": f"Unknown tool requested: {tool_name}",
-                    "tool_used": None,
-                }
-
-            try:
-                tool_result = handler(tool_args)
-            except Exception as exc:
-                logger.exception("Agent tool execution failed: %s", tool_name)
-                return {
-                    "response": f"Tool execution failed: {exc}",
-                    "tool_used": tool_name,
-                    "tool_result": None,
-                }
-
-            # ── Step 3: Second Sarvam call with tool result ──────
+        # ── Step 1: First Sarvam call (streamed, with tools) ──
+        sarvam_resp, tool_task = await _sarvam_chat_overlapped(messages)
+        tool_call = _extract_tool_call(sarvam_resp)
+
+        # ── No tool call → return plain text ─────────────────
+        if tool_call is None:
+            response = {
+                "response": _extract_text(sarvam_resp),
+                "tool_used": None,
+            }
+            _agent_cache_put(cache_key, response)
+            return response
+
+        tool_name: str = tool_call["name"]
+        tool_args: Dict[str, Any] = tool_call["arguments"]
+
+        # ── Step 2: Execute tool via internal dispatch ───────
+        if tool_name not in _AGENT_TOOL_NAMES:
+            return {
+                "response": f"Unknown tool requested: {tool_name}",
+                "tool_used": None,
+            }
+
+        try:
+            if tool_task is not None:
+                tool_result = await tool_task
+            else:
+                tool_result = await _call_tool(tool_name, tool_args)
+        except Exception as exc:
+            logger.exception("Agent tool execution failed: %s", tool_name)
+            return {
+                "response": f"Tool execution failed: {exc}",
+                "tool_used": tool_name,
+                "tool_result": None,
+            }
+
+        # ── Step 3: Local summary, else second Sarvam call ────
+        final_text = _format_tool_summary(tool_name, tool_result, user_message)
+        if final_text is None:
             followup_messages = [
                 {"role": "system", "content": _AGENT_SYSTEM_PROMPT},
                 {"role": "user", "content": user_message},
@@ -508,7 +1064,7 @@ async def agent_endpoint(req: AgentRequest) -> Dict[str, Any]:
                             "type": "function",
                             "function": {
                                 "name": tool_name,
-                                "arguments": json.dumps(tool_args, default=str),
+                                "arguments": orjson.dumps(tool_args, default=str).decode(),
                             },
                         }
                     ],
@@ -516,20 +1072,18 @@ async def agent_endpoint(req: AgentRequest) -> Dict[str, Any]:
                 {
                     "role": "tool",
                     "tool_call_id": "call_1",
-                    "content": json.dumps(tool_result, default=str),
+                    "content": orjson.dumps(tool_result, default=str).decode(),
                 },
             ]
 
-            final_resp = await _sarvam_chat(
-                client, followup_messages, include_tools=False
-            )
+            final_resp = await _sarvam_chat(followup_messages, include_tools=False)
             final_text = _extract_text(final_resp)
 
-            return {
-                "response": final_text,
-                "tool_used": tool_name,
-                "tool_result": tool_result,
-            }
+        return {
+            "response": final_text,
+            "tool_used": tool_name,
+            "tool_result": tool_result,
+        }
 
     except httpx.HTTPStatusError as exc:
         logger.exception("Sarvam API error")
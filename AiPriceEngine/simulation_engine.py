@@ -18,16 +18,27 @@ Route
 GET /simulate/{crop_id}
     Accepts land size and cost parameters. Market price and rainfall
     are automatically fetched from live APIs.
+GET /simulate_all
+    Same inputs; simulates every crop in ``CROP_DATA`` in one batch.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Sequence
 
 import httpx
-from fastapi import APIRouter, HTTPException, Path, Query
-from pydantic import BaseModel, Field
+import numpy as np
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from numba import njit
+from pydantic import BaseModel
 
 logger = logging.getLogger("agrostack.simulation")
 
@@ -45,6 +56,22 @@ MONTHLY_STORAGE_COST_PER_KG: float = 1.5     # ₹/kg/month storage cost
 SEASONAL_MULTIPLIER_3M: float = 1.05   # +5% in 3 months
 SEASONAL_MULTIPLIER_6M: float = 1.10   # +10% in 6 months
 
+# ─── Derived Risk Constants (folded once at import) ─────────────────
+
+_VOL: float = PRICE_VOLATILITY_PERCENT / 100
+_ONE_MINUS_VOL: float = 1 - _VOL
+_ONE_PLUS_VOL: float = 1 + _VOL
+# ₹/kg today → projected price band, e.g. price_3m * (1 - vol)
+_PRICE_3M_LO_MULT: float = SEASONAL_MULTIPLIER_3M * _ONE_MINUS_VOL
+_PRICE_3M_HI_MULT: float = SEASONAL_MULTIPLIER_3M * _ONE_PLUS_VOL
+_PRICE_6M_LO_MULT: float = SEASONAL_MULTIPLIER_6M * _ONE_MINUS_VOL
+_PRICE_6M_HI_MULT: float = SEASONAL_MULTIPLIER_6M * _ONE_PLUS_VOL
+_RISK_LEVEL: str = (
+    "low" if PRICE_VOLATILITY_PERCENT < 8
+    else "medium" if PRICE_VOLATILITY_PERCENT <= 15
+    else "high"
+)
+
 # ─── Confidence Model ───────────────────────────────────────────────
 
 BASE_CONFIDENCE_PERCENT: float = 75.0
@@ -57,6 +84,13 @@ WEATHER_API_URL = (
     "?latitude=9.5916&longitude=76.5227"
     "&hourly=temperature_2m,precipitation,rain,wind_speed_10m"
 )
+WEATHER_CACHE_TTL_S: float = 900.0   # Open-Meteo hourly data; 15 min is fresh
+PRICE_CACHE_TTL_S: float = 300.0     # Mandi modal prices move a few times/day
+# Empty results (no records, HTTP error, timeout, missing API key) are only
+# held long enough to collapse a burst of concurrent misses.
+PRICE_CACHE_EMPTY_TTL_S: float = 5.0
+PRICE_CACHE_MAX_CROPS: int = 64
+SIMULATE_CACHE_CONTROL = "private, max-age=300"
 
 # ─── Crop Database ──────────────────────────────────────────────────
 
@@ -105,6 +139,35 @@ DEFAULT_CROP = {
     "seasonal_rainfall_mm": 1200,
 }
 
+# Frozen lookup rows: crop_id → (base_yield, opt_lo, opt_hi, seasonal_mm)
+_CropRow = tuple[float, float, float, float]
+
+
+def _crop_row(info: Dict[str, Any]) -> _CropRow:
+    opt_lo, opt_hi = info["optimal_temp"]
+    return (
+        info["base_yield_per_acre_kg"], opt_lo, opt_hi,
+        info["seasonal_rainfall_mm"],
+    )
+
+
+_CROP_TABLE: Dict[str, _CropRow] = {k: _crop_row(v) for k, v in CROP_DATA.items()}
+_DEFAULT_CROP_ROW: _CropRow = _crop_row(DEFAULT_CROP)
+
+# Common spellings of known crop ids → interned canonical (lower-case) id,
+# so the warm path avoids allocating a new string with ``str.lower``.
+_CROP_ID_NORMALIZED: Dict[str, str] = {
+    variant: sys.intern(k)
+    for k in CROP_DATA
+    for variant in (k, k.upper(), k.title())
+}
+
+
+def _normalize_crop_id(crop_id: str) -> str:
+    """Return the canonical lower-case form of *crop_id*."""
+    return _CROP_ID_NORMALIZED.get(crop_id) or crop_id.lower()
+
+
 # ─── Rainfall Factor Tiers ──────────────────────────────────────────
 
 RAINFALL_TIERS: List[Dict[str, float]] = [
@@ -115,35 +178,46 @@ RAINFALL_TIERS: List[Dict[str, float]] = [
     {"min_mm":    0, "factor": 0.4},
 ]
 
+# Ascending parallel tuples for a bisect lookup (derived once at import)
+_RAIN_MINS_ASC: tuple[float, ...] = tuple(t["min_mm"] for t in reversed(RAINFALL_TIERS))
+_RAIN_FACTORS_ASC: tuple[float, ...] = tuple(t["factor"] for t in reversed(RAINFALL_TIERS))
+
 # ─── Temperature Factor Ranges ──────────────────────────────────────
 
-TEMP_MODERATE_RANGE = (15, 40)   # °C
+TEMP_MODERATE_LO: float = 15.0   # °C
+TEMP_MODERATE_HI: float = 40.0   # °C
 TEMP_OPTIMAL_FACTOR   = 1.0
 TEMP_MODERATE_FACTOR  = 0.85
 TEMP_EXTREME_FACTOR   = 0.7
 
+# ─── Seasonal Rainfall Heuristic ────────────────────────────────────
+
+_SEASONAL_HOURS: float = 24.0 * 120.0   # 24 h × 120-day season
+
+# ─── Recommendation Templates ───────────────────────────────────────
+# Indexed by the kernel's recommendation code; formatted with keyword
+# arguments break_even, net_3m, net_6m and current.
+
+_RECOMMENDATION_TEMPLATES: tuple[str, ...] = (
+    "⚠️ Current price is below break-even (₹{break_even:.2f}/kg). "
+    "Consider reducing costs or waiting for a price recovery.",
+    "📉 Projected prices remain below break-even. "
+    "Sell now to minimize losses.",
+    "⚡ High market volatility detected. Consider selling "
+    "50% now and holding the rest for better prices.",
+    "📈 Holding for 6 months is projected to yield the highest profit "
+    "(₹{net_6m:,.0f} vs ₹{current:,.0f} now), even after storage costs.",
+    "📊 Selling after 3 months offers better returns "
+    "(₹{net_3m:,.0f} vs ₹{current:,.0f} now) with moderate risk.",
+    "✅ Selling now is your best option at current prices. "
+    "Projected gains don't justify storage costs.",
+)
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Pydantic Models
 # ═══════════════════════════════════════════════════════════════════
 
-class SimulationInputs(BaseModel):
-    """Validated parameters coming from the farmer dashboard."""
-
-    land_size: float = Field(
-        ..., ge=0.0,
-        description="Land size in acres.",
-    )
-    fertilizer_cost: float = Field(
-        ..., ge=0.0,
-        description="Total fertilizer cost (₹).",
-    )
-    labour_cost: float = Field(
-        ..., ge=0.0,
-        description="Total labour cost (₹).",
-    )
-
-
 class WeatherResult(BaseModel):
     """Real-time weather data from Open-Meteo."""
 
@@ -163,37 +237,23 @@ class ProfitRange(BaseModel):
     high: float
 
 
-class SimulationResult(BaseModel):
-    """Structured response returned to the frontend."""
-
-    crop_id: str
-    inputs: Dict[str, float]
-    simulation: Dict[str, Any]
-    weather: Optional[WeatherResult] = None
-    status: str = "success"
-
-
 # ═══════════════════════════════════════════════════════════════════
 # Weather Factor Calculations
 # ═══════════════════════════════════════════════════════════════════
 
-def calculate_rainfall_factor(
-    seasonal_rain_mm: float,
-    tiers: List[Dict[str, float]] = RAINFALL_TIERS,
-) -> float:
+def calculate_rainfall_factor(seasonal_rain_mm: float) -> float:
     """Map seasonal rainfall (mm) to a yield multiplier using tiered thresholds.
 
     1200+ mm → 1.0, 900–1199 → 0.9, 700–899 → 0.75, 500–699 → 0.6, <500 → 0.4
     """
-    for tier in tiers:
-        if seasonal_rain_mm >= tier["min_mm"]:
-            return tier["factor"]
-    return tiers[-1]["factor"]  # Fallback to last (lowest) tier
+    idx = bisect.bisect_right(_RAIN_MINS_ASC, seasonal_rain_mm) - 1
+    return _RAIN_FACTORS_ASC[max(idx, 0)]  # below every tier → lowest factor
 
 
 def calculate_temperature_factor(
     temp_c: float,
-    optimal_range: tuple[float, float] = (20, 35),
+    opt_lo: float = 20.0,
+    opt_hi: float = 35.0,
 ) -> float:
     """Map temperature to a yield multiplier.
 
@@ -201,14 +261,11 @@ def calculate_temperature_factor(
     Within moderate [15, 40]  → 0.85
     Outside both (extreme)    → 0.7
     """
-    opt_lo, opt_hi = optimal_range
-    mod_lo, mod_hi = TEMP_MODERATE_RANGE
-
-    if opt_lo <= temp_c <= opt_hi:
-        return TEMP_OPTIMAL_FACTOR
-    if mod_lo <= temp_c <= mod_hi:
-        return TEMP_MODERATE_FACTOR
-    return TEMP_EXTREME_FACTOR
+    return (
+        TEMP_OPTIMAL_FACTOR if opt_lo <= temp_c <= opt_hi
+        else TEMP_MODERATE_FACTOR if TEMP_MODERATE_LO <= temp_c <= TEMP_MODERATE_HI
+        else TEMP_EXTREME_FACTOR
+    )
 
 
 def estimate_seasonal_rainfall(hourly_rain_mm: float) -> float:
@@ -217,7 +274,188 @@ def estimate_seasonal_rainfall(hourly_rain_mm: float) -> float:
     Very rough heuristic: hourly rate × 24 hours × 120 days (season).
     This is an approximation — in production, aggregate historical data.
     """
-    return hourly_rain_mm * 24 * 120
+    return hourly_rain_mm * _SEASONAL_HOURS
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Numeric Kernel
+# ═══════════════════════════════════════════════════════════════════
+
+# Width of the kernel's output tuple (also the batch output's row width)
+_KERNEL_WIDTH = 15
+
+# Explicit signature → compiled eagerly at import (and loaded from the
+# on-disk cache on later worker starts) instead of on the first request.
+_KERNEL_SIGNATURE = f"UniTuple(f8, {_KERNEL_WIDTH})(" + ", ".join(["f8"] * 13) + ")"
+
+
+@njit(_KERNEL_SIGNATURE, cache=True)
+def _simulate_kernel(
+    base_yield: float,
+    land_size: float,
+    rainfall_factor: float,
+    temp_factor: float,
+    price_per_kg: float,
+    fert: float,
+    labour: float,
+    seasonal_rain_mm: float,
+    vol: float,
+    mult_3m: float,
+    mult_6m: float,
+    storage_per_kg_mo: float,
+    max_yield_acre: float,
+) -> tuple:
+    """Floating-point core of :func:`run_simulation` (steps 4–10), compiled.
+
+    Returns ``(adjusted_yield_kg, gross_revenue, total_cost,
+    predicted_profit, break_even_price, profit_low, profit_high, price_3m,
+    price_6m, storage_3m, storage_6m, net_3m, net_6m, confidence,
+    recommendation_code)``; the code indexes ``_RECOMMENDATION_TEMPLATES``.
+    """
+    # Adjusted yield, capped at max_yield_acre kg/acre
+    adjusted_yield_kg = base_yield * rainfall_factor * temp_factor * land_size
+    if adjusted_yield_kg / max(land_size, 0.01) > max_yield_acre:
+        adjusted_yield_kg = max_yield_acre * land_size
+
+    # Revenue, profit, break-even
+    gross_revenue = adjusted_yield_kg * price_per_kg
+    total_cost = fert + labour
+    predicted_profit = gross_revenue - total_cost
+    break_even_price = total_cost / max(adjusted_yield_kg, 0.01)
+
+    # Volatility range
+    profit_low = gross_revenue * (1.0 - vol) - total_cost
+    profit_high = gross_revenue * (1.0 + vol) - total_cost
+
+    # Forward projection with storage
+    price_3m = price_per_kg * mult_3m
+    price_6m = price_per_kg * mult_6m
+    storage_per_month = adjusted_yield_kg * storage_per_kg_mo
+    storage_3m = storage_per_month * 3.0
+    storage_6m = storage_per_month * 6.0
+    net_3m = adjusted_yield_kg * price_3m - total_cost - storage_3m
+    net_6m = adjusted_yield_kg * price_6m - total_cost - storage_6m
+
+    # Confidence (clamped 0–100)
+    confidence = BASE_CONFIDENCE_PERCENT
+    if PRICE_VOLATILITY_PERCENT > 15:
+        confidence -= CONFIDENCE_REDUCE_HIGH_VOLATILITY
+    if seasonal_rain_mm < LOW_RAINFALL_THRESHOLD_MM:
+        confidence -= CONFIDENCE_REDUCE_LOW_RAINFALL
+    confidence = max(0.0, min(100.0, confidence))
+
+    # Recommendation (first matching rule wins)
+    if price_per_kg < break_even_price:
+        code = 0.0   # below break-even now
+    elif price_3m < break_even_price and price_6m < break_even_price:
+        code = 1.0   # below break-even at every horizon
+    elif PRICE_VOLATILITY_PERCENT > 15:
+        code = 2.0   # high volatility
+    elif net_6m > net_3m and net_6m > predicted_profit:
+        code = 3.0   # hold 6 months
+    elif net_3m > predicted_profit:
+        code = 4.0   # hold 3 months
+    else:
+        code = 5.0   # sell now
+
+    return (
+        adjusted_yield_kg, gross_revenue, total_cost, predicted_profit,
+        break_even_price, profit_low, profit_high, price_3m, price_6m,
+        storage_3m, storage_6m, net_3m, net_6m, confidence, code,
+    )
+
+
+# Warm-up call: any residual first-call dispatch cost is paid at startup.
+_simulate_kernel(
+    1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.12, 1.0, 1.0, 0.0, 1.0,
+)
+
+# CROP_DATA in batch row order (row i ↔ _BATCH_CROP_IDS[i])
+_BATCH_CROP_IDS: tuple[str, ...] = tuple(CROP_DATA)
+_BASE_YIELDS = np.array(
+    [_CROP_TABLE[c][0] for c in _BATCH_CROP_IDS], dtype=np.float64,
+)
+
+
+# Serial on purpose: CROP_DATA has only 7 crops, far too few to pay for a
+# threading layer, and an explicit signature keeps compilation at import like _simulate_kernel.
+_BATCH_KERNEL_SIGNATURE = "f8[:, :](f8[:], f8[:], f8[:], " + ", ".join(["f8"] * 10) + ")"
+
+
+@njit(_BATCH_KERNEL_SIGNATURE, cache=True)
+def _simulate_batch_kernel(
+    base_yields: np.ndarray,
+    temp_factors: np.ndarray,
+    prices_per_kg: np.ndarray,
+    land_size: float,
+    fert: float,
+    labour: float,
+    rainfall_factor: float,
+    seasonal_rain_mm: float,
+    vol: float,
+    mult_3m: float,
+    mult_6m: float,
+    storage_per_kg_mo: float,
+    max_yield_acre: float,
+) -> np.ndarray:
+    """Run :func:`_simulate_kernel` for every crop row."""
+    n = base_yields.shape[0]
+    out = np.empty((n, _KERNEL_WIDTH))
+    for i in range(n):
+        r = _simulate_kernel(
+            base_yields[i], land_size, rainfall_factor, temp_factors[i],
+            prices_per_kg[i], fert, labour, seasonal_rain_mm, vol,
+            mult_3m, mult_6m, storage_per_kg_mo, max_yield_acre,
+        )
+        for j in range(_KERNEL_WIDTH):
+            out[i, j] = r[j]
+    return out
+
+
+def run_simulation_batch(
+    prices_quintal: np.ndarray,
+    rain_mm_hourly: float,
+    temperature_c: float,
+    land_size: float,
+    fertilizer_cost: float,
+    labour_cost: float,
+) -> tuple[np.ndarray, list[float], float, float]:
+    """Simulate every crop in ``CROP_DATA`` in one kernel call.
+
+    Parameters
+    ----------
+    prices_quintal : np.ndarray
+        Market price per crop (₹/quintal), ordered as ``_BATCH_CROP_IDS``.
+    rain_mm_hourly, temperature_c : float
+        Shared weather inputs (one location for all crops).
+    land_size, fertilizer_cost, labour_cost : float
+        User inputs, as for :func:`run_simulation`.
+
+    Returns
+    -------
+    rows : np.ndarray
+        ``(n_crops, _KERNEL_WIDTH)`` array; each row is a ``_simulate_kernel`` tuple.
+    temp_factors : list[float]
+        Per-crop temperature factor fed to the kernel.
+    rainfall_factor, seasonal_rain_mm : float
+        Shared rainfall inputs fed to the kernel.
+    """
+    seasonal_rain_mm = rain_mm_hourly * _SEASONAL_HOURS
+    rainfall_factor = calculate_rainfall_factor(seasonal_rain_mm)
+    temp_factors = [
+        calculate_temperature_factor(temperature_c, *_CROP_TABLE[c][1:3])
+        for c in _BATCH_CROP_IDS
+    ]
+    rows = _simulate_batch_kernel(
+        _BASE_YIELDS, np.array(temp_factors, dtype=np.float64),
+        np.asarray(prices_quintal, dtype=np.float64) / KG_PER_QUINTAL,
+        land_size, fertilizer_cost, labour_cost,
+        rainfall_factor, seasonal_rain_mm,
+        _VOL,
+        SEASONAL_MULTIPLIER_3M, SEASONAL_MULTIPLIER_6M,
+        MONTHLY_STORAGE_COST_PER_KG, MAX_YIELD_PER_ACRE_KG,
+    )
+    return rows, temp_factors, rainfall_factor, seasonal_rain_mm
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -228,7 +466,9 @@ def run_simulation(
     market_price_per_quintal: float,
     rain_mm_hourly: float,
     temperature_c: float,
-    inputs: SimulationInputs,
+    land_size: float,
+    fertilizer_cost: float,
+    labour_cost: float,
     crop_id: str,
 ) -> Dict[str, Any]:
     """Execute the deterministic profit-simulation formula.
@@ -243,8 +483,12 @@ def run_simulation(
         Current hourly rainfall (mm) from Open-Meteo API.
     temperature_c : float
         Current temperature (°C) from Open-Meteo API.
-    inputs : SimulationInputs
-        User-adjustable parameters (land size, costs).
+    land_size : float
+        Land size in acres (validated ``>= 0`` by the route).
+    fertilizer_cost : float
+        Total fertilizer cost (₹).
+    labour_cost : float
+        Total labour cost (₹).
     crop_id : str
         Crop identifier for looking up base yield data.
 
@@ -254,154 +498,104 @@ def run_simulation(
         All intermediate + final values for full transparency.
     """
     # ── 1. Get crop-specific data ──────────────────────────────────
-    crop_info = CROP_DATA.get(crop_id.lower(), DEFAULT_CROP)
-    base_yield_per_acre_kg = crop_info["base_yield_per_acre_kg"]
-    optimal_temp = crop_info["optimal_temp"]
+    base_yield_per_acre_kg, opt_lo, opt_hi, _ = _CROP_TABLE.get(
+        _normalize_crop_id(crop_id), _DEFAULT_CROP_ROW,
+    )
 
     # ── 2. Convert price: ₹/quintal → ₹/kg ────────────────────────
     market_price_per_kg = market_price_per_quintal / KG_PER_QUINTAL
 
     # ── 3. Calculate weather factors ───────────────────────────────
-    seasonal_rain_mm = estimate_seasonal_rainfall(rain_mm_hourly)
+    seasonal_rain_mm = rain_mm_hourly * _SEASONAL_HOURS  # estimate_seasonal_rainfall
     rainfall_factor = calculate_rainfall_factor(seasonal_rain_mm)
-    temperature_factor = calculate_temperature_factor(temperature_c, optimal_temp)
-
-    # ── 4. Adjusted yield (kg) ─────────────────────────────────────
-    adjusted_yield_kg = (
-        base_yield_per_acre_kg
-        * rainfall_factor
-        * temperature_factor
-        * inputs.land_size
+    temperature_factor = calculate_temperature_factor(temperature_c, opt_lo, opt_hi)
+
+    # ── 4–10. Yield, revenue, risk, projections, confidence ───────
+    kernel_out = _simulate_kernel(
+        float(base_yield_per_acre_kg), land_size, rainfall_factor,
+        temperature_factor, market_price_per_kg, fertilizer_cost,
+        labour_cost, seasonal_rain_mm, _VOL,
+        SEASONAL_MULTIPLIER_3M, SEASONAL_MULTIPLIER_6M,
+        MONTHLY_STORAGE_COST_PER_KG, MAX_YIELD_PER_ACRE_KG,
+    )
+    return _simulation_payload(
+        base_yield_per_acre_kg, market_price_per_kg, rainfall_factor,
+        temperature_factor, seasonal_rain_mm, kernel_out,
     )
 
-    # ── 5. Validation: cap yield at 6000 kg/acre ──────────────────
-    yield_per_acre = adjusted_yield_kg / max(inputs.land_size, 0.01)
-    if yield_per_acre > MAX_YIELD_PER_ACRE_KG:
-        adjusted_yield_kg = MAX_YIELD_PER_ACRE_KG * inputs.land_size
-
-    # ── 6. Revenue & Profit ────────────────────────────────────────
-    gross_revenue = adjusted_yield_kg * market_price_per_kg
-    total_cost = inputs.fertilizer_cost + inputs.labour_cost
-    predicted_profit = gross_revenue - total_cost
-
-    # ── 7. Break-Even Price ──────────────────────────────────────────
-    break_even_price = total_cost / max(adjusted_yield_kg, 0.01)
-
-    # ── 8. Risk Analysis ───────────────────────────────────────────
-    vol = PRICE_VOLATILITY_PERCENT / 100
-    profit_low  = (adjusted_yield_kg * market_price_per_kg * (1 - vol)) - total_cost
-    profit_high = (adjusted_yield_kg * market_price_per_kg * (1 + vol)) - total_cost
-
-    # Risk level based on volatility thresholds
-    if PRICE_VOLATILITY_PERCENT < 8:
-        risk_level = "low"
-    elif PRICE_VOLATILITY_PERCENT <= 15:
-        risk_level = "medium"
-    else:
-        risk_level = "high"
-
-    # ── 9. Forward Price Projection with Storage Costs ─────────────
-    price_3m = market_price_per_kg * SEASONAL_MULTIPLIER_3M
-    price_6m = market_price_per_kg * SEASONAL_MULTIPLIER_6M
-
-    # Storage costs
-    storage_cost_3m = adjusted_yield_kg * MONTHLY_STORAGE_COST_PER_KG * 3
-    storage_cost_6m = adjusted_yield_kg * MONTHLY_STORAGE_COST_PER_KG * 6
 
-    # Net profits after storage
-    revenue_3m = adjusted_yield_kg * price_3m
-    revenue_6m = adjusted_yield_kg * price_6m
-    net_profit_3m = revenue_3m - total_cost - storage_cost_3m
-    net_profit_6m = revenue_6m - total_cost - storage_cost_6m
-    current_profit = gross_revenue - total_cost  # selling now, no storage
+def _simulation_payload(
+    base_yield_per_acre_kg: float,
+    market_price_per_kg: float,
+    rainfall_factor: float,
+    temperature_factor: float,
+    seasonal_rain_mm: float,
+    kernel_out: Sequence[float],
+) -> Dict[str, Any]:
+    """Label, recommend and shape one crop's kernel output for the API."""
+    (
+        adjusted_yield_kg, gross_revenue, total_cost, predicted_profit,
+        break_even_price, profit_low, profit_high, price_3m, price_6m,
+        storage_cost_3m, storage_cost_6m, net_profit_3m, net_profit_6m,
+        confidence, recommendation_code,
+    ) = kernel_out
+    current_profit = predicted_profit  # selling now, no storage
 
     # Volatility bands for projected prices
-    low_price_3m  = price_3m * (1 - vol)
-    high_price_3m = price_3m * (1 + vol)
-    low_price_6m  = price_6m * (1 - vol)
-    high_price_6m = price_6m * (1 + vol)
-
-    # ── 10. Confidence Score ───────────────────────────────────────
-    confidence = BASE_CONFIDENCE_PERCENT
-    if PRICE_VOLATILITY_PERCENT > 15:
-        confidence -= CONFIDENCE_REDUCE_HIGH_VOLATILITY
-    if seasonal_rain_mm < LOW_RAINFALL_THRESHOLD_MM:
-        confidence -= CONFIDENCE_REDUCE_LOW_RAINFALL
-    confidence = max(0, min(100, confidence))  # clamp 0–100
+    low_price_3m  = market_price_per_kg * _PRICE_3M_LO_MULT
+    high_price_3m = market_price_per_kg * _PRICE_3M_HI_MULT
+    low_price_6m  = market_price_per_kg * _PRICE_6M_LO_MULT
+    high_price_6m = market_price_per_kg * _PRICE_6M_HI_MULT
 
     # ── 11. Smart Recommendation ───────────────────────────────────
-    if market_price_per_kg < break_even_price:
-        recommendation = (
-            "⚠️ Current price is below break-even (₹{:.2f}/kg). "
-            "Consider reducing costs or waiting for a price recovery."
-        ).format(break_even_price)
-    elif price_3m < break_even_price and price_6m < break_even_price:
-        recommendation = (
-            "📉 Projected prices remain below break-even. "
-            "Sell now to minimize losses."
-        )
-    elif risk_level == "high":
-        recommendation = (
-            "⚡ High market volatility detected. Consider selling "
-            "50% now and holding the rest for better prices."
-        )
-    elif net_profit_6m > net_profit_3m and net_profit_6m > current_profit:
-        recommendation = (
-            "📈 Holding for 6 months is projected to yield the highest profit "
-            "(₹{:,.0f} vs ₹{:,.0f} now), even after storage costs."
-        ).format(net_profit_6m, current_profit)
-    elif net_profit_3m > current_profit:
-        recommendation = (
-            "📊 Selling after 3 months offers better returns "
-            "(₹{:,.0f} vs ₹{:,.0f} now) with moderate risk."
-        ).format(net_profit_3m, current_profit)
-    else:
-        recommendation = (
-            "✅ Selling now is your best option at current prices. "
-            "Projected gains don't justify storage costs."
-        )
+    recommendation = _RECOMMENDATION_TEMPLATES[int(recommendation_code)].format(
+        break_even=break_even_price,
+        net_3m=net_profit_3m,
+        net_6m=net_profit_6m,
+        current=current_profit,
+    )
 
     return {
-        "base_yield_per_acre_kg": round(base_yield_per_acre_kg, 2),
-        "adjusted_yield_kg": round(adjusted_yield_kg, 2),
-        "market_price_per_kg": round(market_price_per_kg, 2),
-        "rainfall_factor": round(rainfall_factor, 4),
-        "temperature_factor": round(temperature_factor, 4),
-        "seasonal_rain_estimate_mm": round(seasonal_rain_mm, 2),
-        "gross_revenue": round(gross_revenue, 2),
-        "total_cost": round(total_cost, 2),
-        "predicted_profit": round(predicted_profit, 2),
-        "break_even_price": round(break_even_price, 2),
+        "base_yield_per_acre_kg": base_yield_per_acre_kg,
+        "adjusted_yield_kg": adjusted_yield_kg,
+        "market_price_per_kg": market_price_per_kg,
+        "rainfall_factor": rainfall_factor,
+        "temperature_factor": temperature_factor,
+        "seasonal_rain_estimate_mm": seasonal_rain_mm,
+        "gross_revenue": gross_revenue,
+        "total_cost": total_cost,
+        "predicted_profit": predicted_profit,
+        "break_even_price": break_even_price,
         "profit_range": {
-            "low": round(profit_low, 2),
-            "high": round(profit_high, 2),
+            "low": profit_low,
+            "high": profit_high,
         },
         "forward_projection": {
             "current": {
-                "price_per_kg": round(market_price_per_kg, 2),
-                "profit": round(current_profit, 2),
+                "price_per_kg": market_price_per_kg,
+                "profit": current_profit,
             },
             "three_month": {
-                "expected_price": round(price_3m, 2),
+                "expected_price": price_3m,
                 "price_range": {
-                    "low": round(low_price_3m, 2),
-                    "high": round(high_price_3m, 2),
+                    "low": low_price_3m,
+                    "high": high_price_3m,
                 },
-                "storage_cost": round(storage_cost_3m, 2),
-                "net_profit_after_storage": round(net_profit_3m, 2),
+                "storage_cost": storage_cost_3m,
+                "net_profit_after_storage": net_profit_3m,
             },
             "six_month": {
-                "expected_price": round(price_6m, 2),
+                "expected_price": price_6m,
                 "price_range": {
-                    "low": round(low_price_6m, 2),
-                    "high": round(high_price_6m, 2),
+                    "low": low_price_6m,
+                    "high": high_price_6m,
                 },
-                "storage_cost": round(storage_cost_6m, 2),
-                "net_profit_after_storage": round(net_profit_6m, 2),
+                "storage_cost": storage_cost_6m,
+                "net_profit_after_storage": net_profit_6m,
             },
         },
-        "risk_level": risk_level,
-        "confidence_score_percent": round(confidence, 1),
+        "risk_level": _RISK_LEVEL,
+        "confidence_score_percent": confidence,
         "recommendation": recommendation,
     }
 
@@ -410,30 +604,232 @@ def run_simulation(
 # Weather Fetch
 # ═══════════════════════════════════════════════════════════════════
 
-async def fetch_weather_forecast() -> Optional[WeatherResult]:
-    """Fetch current weather forecast from Open-Meteo."""
+# One keep-alive client for the module, created on first use (inside the
+# running event loop) and closed by the host app via ``close_http_client``.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# (fetched_at monotonic, result) -- the coordinates are fixed, so one slot.
+_weather_cache: Optional[tuple[float, WeatherResult]] = None
+# The Open-Meteo request currently in flight, shared by concurrent misses.
+_weather_inflight: "Optional[asyncio.Task[Optional[WeatherResult]]]" = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Open-Meteo client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=5.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (call from the app's shutdown hook)."""
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _cached_weather() -> Optional[WeatherResult]:
+    if _weather_cache is not None:
+        fetched_at, result = _weather_cache
+        if time.monotonic() - fetched_at < WEATHER_CACHE_TTL_S:
+            return result
+    return None
+
+
+async def _fetch_weather_uncached() -> Optional[WeatherResult]:
+    """One Open-Meteo round-trip; caches and returns the result (None on error)."""
+    global _weather_cache
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(WEATHER_API_URL, timeout=5.0)
-            response.raise_for_status()
-            data = response.json()
-
-            hourly = data.get("hourly", {})
-            if not hourly:
-                return None
-
-            idx = 0
-
-            return WeatherResult(
-                temperature=hourly["temperature_2m"][idx],
-                precipitation=hourly["precipitation"][idx],
-                rain=hourly["rain"][idx],
-                wind_speed=hourly["wind_speed_10m"][idx],
-            )
+        response = await _get_http_client().get(WEATHER_API_URL)
+        response.raise_for_status()
+        data = response.json()
+
+        hourly = data.get("hourly", {})
+        if not hourly:
+            return None
+
+        idx = 0
+
+        result = WeatherResult(
+            temperature=hourly["temperature_2m"][idx],
+            precipitation=hourly["precipitation"][idx],
+            rain=hourly["rain"][idx],
+            wind_speed=hourly["wind_speed_10m"][idx],
+        )
     except Exception as exc:
         logger.warning(f"Weather fetch failed: {exc}")
         return None
 
+    _weather_cache = (time.monotonic(), result)
+    return result
+
+
+def _clear_weather_inflight(task: "asyncio.Task[Optional[WeatherResult]]") -> None:
+    global _weather_inflight
+    if _weather_inflight is task:
+        _weather_inflight = None
+
+
+async def fetch_weather_forecast() -> Optional[WeatherResult]:
+    """Fetch current weather forecast from Open-Meteo.
+
+    Successful results are cached for ``WEATHER_CACHE_TTL_S`` seconds.
+    Concurrent misses all await the same in-flight request, so they
+    succeed -- or fail -- together after a single round-trip.
+    """
+    global _weather_inflight
+    cached = _cached_weather()
+    if cached is not None:
+        return cached
+
+    task = _weather_inflight
+    if task is None:
+        task = asyncio.ensure_future(_fetch_weather_uncached())
+        task.add_done_callback(_clear_weather_inflight)
+        _weather_inflight = task
+    # shield: a cancelled caller must not cancel the fetch others await
+    return await asyncio.shield(task)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Market Price Fetch
+# ═══════════════════════════════════════════════════════════════════
+
+# crop key -> (expires_at monotonic, market_data), least recently used first
+_price_cache: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_price_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def _cached_price(crop_key: str) -> Optional[Dict[str, Any]]:
+    entry = _price_cache.get(crop_key)
+    if entry is not None and time.monotonic() < entry[0]:
+        _price_cache.move_to_end(crop_key)
+        return entry[1]
+    return None
+
+
+async def fetch_market_data(live_informer: Any, crop_id: str) -> Dict[str, Any]:
+    """Return ``live_informer.fetch(crop_id)``, cached per crop.
+
+    Results with records are kept for ``PRICE_CACHE_TTL_S`` seconds; empty
+    results -- which ``LivePriceInformer.fetch`` also returns on upstream
+    errors -- only for ``PRICE_CACHE_EMPTY_TTL_S``. At most
+    ``PRICE_CACHE_MAX_CROPS`` crops are kept (LRU-evicted); concurrent
+    misses for the same crop share one upstream request. Exceptions
+    propagate uncached.
+    """
+    crop_key = _normalize_crop_id(crop_id)
+    cached = _cached_price(crop_key)
+    if cached is not None:
+        return cached
+
+    async with _price_locks[crop_key]:
+        cached = _cached_price(crop_key)
+        if cached is not None:
+            return cached
+
+        market_data = await live_informer.fetch(crop_id)
+        ttl = (
+            PRICE_CACHE_TTL_S if market_data.get("record_count", 0) > 0
+            else PRICE_CACHE_EMPTY_TTL_S
+        )
+        _price_cache[crop_key] = (time.monotonic() + ttl, market_data)
+        _price_cache.move_to_end(crop_key)
+        while len(_price_cache) > PRICE_CACHE_MAX_CROPS:
+            evicted, _ = _price_cache.popitem(last=False)
+            lock = _price_locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del _price_locks[evicted]
+        return market_data
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Route Helpers
+# ═══════════════════════════════════════════════════════════════════
+
+def _price_from_market_data(market_data: Any) -> float:
+    """Average modal price (₹/quintal), or the fallback on error/no data."""
+    if isinstance(market_data, dict) and market_data.get("record_count", 0) > 0:
+        return market_data["avg_modal"]
+    return FALLBACK_PRICE_PER_QUINTAL
+
+
+def _resolve_weather(
+    temperature: Optional[float],
+    precipitation: Optional[float],
+    rain: Optional[float],
+    wind_speed: Optional[float],
+    weather_res: Optional[WeatherResult],
+) -> Dict[str, Any]:
+    """Consolidate weather (user override > API > defaults) for the response."""
+    return {
+        "temperature": (
+            temperature if temperature is not None
+            else (weather_res.temperature if weather_res else 25.0)
+        ),
+        "precipitation": (
+            precipitation if precipitation is not None
+            else (weather_res.precipitation if weather_res else 0.0)
+        ),
+        "rain": (
+            rain if rain is not None
+            else (weather_res.rain if weather_res else 0.0)
+        ),
+        "wind_speed": (
+            wind_speed if wind_speed is not None
+            else (weather_res.wind_speed if weather_res else 5.0)
+        ),
+        "unit_temp": "°C",
+        "unit_precip": "mm",
+        "unit_rain": "mm",
+        "unit_wind": "km/h",
+    }
+
+
+def _simulation_etag(
+    crop_id: str,
+    land_size: float,
+    fertilizer_cost: float,
+    labour_cost: float,
+    price_quintal: float,
+    weather: Dict[str, Any],
+) -> str:
+    """Strong ETag over everything a ``/simulate`` response depends on.
+
+    Slider inputs are bucketed (0.1 acre, ₹100) so settle jitter maps to
+    one tag; price and weather are the resolved (cached or overridden)
+    values, so the tag changes exactly when the live data does.
+    """
+    key = repr((
+        crop_id,
+        round(land_size, 1),
+        round(fertilizer_cost, -2),
+        round(labour_cost, -2),
+        price_quintal,
+        weather["temperature"],
+        weather["precipitation"],
+        weather["rain"],
+        weather["wind_speed"],
+    )).encode()
+    return '"' + hashlib.blake2b(key, digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of *etag* against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Router Factory
@@ -449,8 +845,10 @@ def create_simulation_router(live_informer: Any) -> APIRouter:
     """
     router = APIRouter(tags=["Simulation"])
 
-    @router.get("/simulate/{crop_id}")
+    @router.get("/simulate/{crop_id}", response_class=ORJSONResponse)
     async def simulate(
+        request: Request,
+        response: Response,
         crop_id: str = Path(
             ..., description="Crop identifier (e.g. rubber, coconut, rice).",
         ),
@@ -480,84 +878,166 @@ def create_simulation_router(live_informer: Any) -> APIRouter:
             None,
             description="Override wind speed (km/h). If omitted, fetches live data from Open-Meteo.",
         ),
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """Run a What-If profit simulation for a given crop.
 
         Market price is fetched live from DATA_GOV API (₹/quintal → ₹/kg).
         Weather/rainfall data is fetched live from Open-Meteo API.
         All yields are in **kg**, all prices in **₹/kg**.
         Includes ±10% price volatility risk analysis.
+        Responses carry an ``ETag``; a matching ``If-None-Match`` gets a
+        304 without re-running the simulation.
         """
-        # ── 1. Fetch live market price from DATA_GOV API ──────────
-        base_price_quintal = FALLBACK_PRICE_PER_QUINTAL
-        try:
-            market_data = await live_informer.fetch(crop_id)
-            if market_data["record_count"] > 0:
-                base_price_quintal = market_data["avg_modal"]
-        except Exception:
-            pass
+        cid = _normalize_crop_id(crop_id)
 
-        # ── 2. Fetch weather from Open-Meteo (if any param missing)
+        # ── 1–2. Fetch live market price (DATA_GOV) and, if any param
+        #         is missing, weather (Open-Meteo) concurrently ─────
+        need_weather = any(
+            v is None for v in (temperature, precipitation, rain, wind_speed)
+        )
+        fetches = [fetch_market_data(live_informer, cid)]
+        if need_weather:
+            fetches.append(fetch_weather_forecast())
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+
+        base_price_quintal = _price_from_market_data(results[0])
         weather_res = None
-        if any(v is None for v in [temperature, precipitation, rain, wind_speed]):
-            weather_res = await fetch_weather_forecast()
+        if need_weather and not isinstance(results[1], BaseException):
+            weather_res = results[1]
+        weather = _resolve_weather(
+            temperature, precipitation, rain, wind_speed, weather_res,
+        )
 
-        # Consolidate weather (User override > API > Defaults)
-        final_temp = (
-            temperature if temperature is not None
-            else (weather_res.temperature if weather_res else 25.0)
+        etag = _simulation_etag(
+            cid, land_size, fertilizer_cost, labour_cost,
+            base_price_quintal, weather,
         )
-        final_precip = (
-            precipitation if precipitation is not None
-            else (weather_res.precipitation if weather_res else 0.0)
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": SIMULATE_CACHE_CONTROL},
+            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = SIMULATE_CACHE_CONTROL
+
+        # ── 3. Run simulation using live data ─────────────────────
+        #       (inputs already validated by the Query(ge=0) params)
+        try:
+            simulation = run_simulation(
+                market_price_per_quintal=base_price_quintal,
+                rain_mm_hourly=weather["rain"],
+                temperature_c=weather["temperature"],
+                land_size=land_size,
+                fertilizer_cost=fertilizer_cost,
+                labour_cost=labour_cost,
+                crop_id=cid,
+            )
+        except Exception:
+            logger.exception("Simulation calculation error for %s", cid)
+            raise HTTPException(status_code=500, detail="Internal error.")
+
+        # ── 4. Build response ─────────────────────────────────────
+        return {
+            "crop_id": cid,
+            "inputs": {
+                "land_size": land_size,
+                "fertilizer_cost": fertilizer_cost,
+                "labour_cost": labour_cost,
+            },
+            "simulation": simulation,
+            "weather": weather,
+            "status": "success",
+        }
+
+    @router.get("/simulate_all", response_class=ORJSONResponse)
+    async def simulate_all(
+        land_size: float = Query(
+            1.0, ge=0.0, description="Land size in acres.",
+        ),
+        fertilizer_cost: float = Query(
+            0.0, ge=0.0, description="Total fertilizer cost (₹).",
+        ),
+        labour_cost: float = Query(
+            0.0, ge=0.0, description="Total labour cost (₹).",
+        ),
+        temperature: Optional[float] = Query(
+            None,
+            description="Override temperature (°C). If omitted, fetches live data from Open-Meteo.",
+        ),
+        precipitation: Optional[float] = Query(
+            None,
+            description="Override precipitation (mm). If omitted, fetches live data from Open-Meteo.",
+        ),
+        rain: Optional[float] = Query(
+            None,
+            description="Override rain (mm). If omitted, fetches live data from Open-Meteo.",
+        ),
+        wind_speed: Optional[float] = Query(
+            None,
+            description="Override wind speed (km/h). If omitted, fetches live data from Open-Meteo.",
+        ),
+    ) -> Dict[str, Any]:
+        """Run the What-If simulation for every known crop at once.
+
+        Same inputs and per-crop ``simulation`` payload as
+        ``/simulate/{crop_id}``; prices and weather are fetched
+        concurrently and all crops go through one batch kernel call.
+        """
+        need_weather = any(
+            v is None for v in (temperature, precipitation, rain, wind_speed)
         )
-        final_rain = (
-            rain if rain is not None
-            else (weather_res.rain if weather_res else 0.0)
+        fetches = [fetch_market_data(live_informer, c) for c in _BATCH_CROP_IDS]
+        if need_weather:
+            fetches.append(fetch_weather_forecast())
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+
+        n_crops = len(_BATCH_CROP_IDS)
+        prices_quintal = np.array(
+            [_price_from_market_data(r) for r in results[:n_crops]],
+            dtype=np.float64,
         )
-        final_wind = (
-            wind_speed if wind_speed is not None
-            else (weather_res.wind_speed if weather_res else 5.0)
+        weather_res = None
+        if need_weather and not isinstance(results[n_crops], BaseException):
+            weather_res = results[n_crops]
+        weather = _resolve_weather(
+            temperature, precipitation, rain, wind_speed, weather_res,
         )
 
-        # ── 3. Pack user inputs ───────────────────────────────────
         try:
-            inputs = SimulationInputs(
+            batch, temp_factors, rainfall_factor, seasonal_rain_mm = run_simulation_batch(
+                prices_quintal,
+                rain_mm_hourly=weather["rain"],
+                temperature_c=weather["temperature"],
                 land_size=land_size,
                 fertilizer_cost=fertilizer_cost,
                 labour_cost=labour_cost,
             )
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=str(exc))
+        except Exception:
+            logger.exception("Batch simulation calculation error")
+            raise HTTPException(status_code=500, detail="Internal error.")
 
-        # ── 4. Run simulation using live data ─────────────────────
-        try:
-            simulation = run_simulation(
-                market_price_per_quintal=base_price_quintal,
-                rain_mm_hourly=final_rain,
-                temperature_c=final_temp,
-                inputs=inputs,
-                crop_id=crop_id,
+        simulations = {}
+        # .tolist() → plain Python floats for the JSON encoder
+        for i, row in enumerate(batch.tolist()):
+            crop_id = _BATCH_CROP_IDS[i]
+            simulations[crop_id] = _simulation_payload(
+                _CROP_TABLE[crop_id][0],
+                prices_quintal[i].item() / KG_PER_QUINTAL,
+                rainfall_factor,
+                temp_factors[i],
+                seasonal_rain_mm,
+                row,
             )
-        except Exception as exc:
-            logger.error("Simulation calculation error: %s", exc)
-            raise HTTPException(status_code=500, detail="Internal error.")
 
-        # ── 5. Build response ─────────────────────────────────────
-        return SimulationResult(
-            crop_id=crop_id.lower(),
-            inputs={
-                "land_size": inputs.land_size,
-                "fertilizer_cost": inputs.fertilizer_cost,
-                "labour_cost": inputs.labour_cost,
+        return {
+            "inputs": {
+                "land_size": land_size,
+                "fertilizer_cost": fertilizer_cost,
+                "labour_cost": labour_cost,
             },
-            simulation=simulation,
-            weather=WeatherResult(
-                temperature=final_temp,
-                precipitation=final_precip,
-                rain=final_rain,
-                wind_speed=final_wind,
-            ),
-        ).model_dump()
+            "simulations": simulations,
+            "weather": weather,
+            "status": "success",
+        }
 
     return router
@@ -0,0 +1,133 @@
+"""push_to_inventory must hand asyncpg values of the column types."""
+
+import asyncio
+import datetime as dt
+import os
+import sys
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sarvamXsupa  # noqa: E402
+
+# Parameter types of the INSERT as reported by Postgres for the inventory table.
+_PARAM_TYPES = ("text", "text", "numeric", "text", "numeric", "bool", "timestamp")
+
+_ROW = {
+    "id": 42,
+    "cropName": "Wheat",
+    "quantity": "12.5",
+    "unit": "quintal",
+    "marketPrice": "2275",
+    "isProfitable": "true",
+    "addedAt": "2024-06-01T09:30:00Z",
+}
+
+
+class _FakeConn:
+    def __init__(self):
+        self.executed = []
+        self.copied = None
+
+    async def prepare(self, sql):
+        params = [SimpleNamespace(name=name) for name in _PARAM_TYPES]
+        return SimpleNamespace(get_parameters=lambda: params)
+
+    async def execute(self, sql, *args):
+        self.executed.append(args)
+
+    async def executemany(self, sql, records):
+        self.executed.extend(records)
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied = records
+
+    def transaction(self):
+        return _AsyncNull()
+
+
+class _AsyncNull:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self, timeout=None):
+        conn = self.conn
+
+        class _Ctx(_AsyncNull):
+            async def __aenter__(self):
+                return conn
+
+        return _Ctx()
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    fake = _FakeConn()
+
+    async def _get_pool():
+        return _FakePool(fake)
+
+    monkeypatch.setattr(sarvamXsupa, "_get_pool", _get_pool)
+    monkeypatch.setattr(sarvamXsupa, "_row_converters", None)
+    return fake
+
+
+_EXPECTED = (
+    "42",
+    "Wheat",
+    Decimal("12.5"),
+    "quintal",
+    Decimal("2275"),
+    True,
+    dt.datetime(2024, 6, 1, 9, 30),
+)
+
+
+def test_push_converts_z_timestamp_and_string_quantity(conn):
+    asyncio.run(sarvamXsupa._push_to_inventory(dict(_ROW)))
+    assert conn.executed == [_EXPECTED]
+    assert conn.executed[0][-1].tzinfo is None
+
+
+def test_push_many_converts_on_executemany_and_copy(conn):
+    asyncio.run(sarvamXsupa._push_many_to_inventory({"rows": [dict(_ROW)] * 3}))
+    assert conn.executed == [_EXPECTED] * 3
+
+    n = sarvamXsupa._COPY_THRESHOLD
+    asyncio.run(sarvamXsupa._push_many_to_inventory({"rows": [dict(_ROW)] * n}))
+    assert conn.copied == [_EXPECTED] * n
+
+
+def test_timestamptz_column_keeps_utc_offset():
+    (convert,) = sarvamXsupa._converters_for(("timestamptz",))
+    value = convert("2024-06-01T15:00:00+05:30")
+    assert value == dt.datetime(2024, 6, 1, 9, 30, tzinfo=dt.timezone.utc)
+
+
+def test_invalid_quantity_is_a_value_error(conn):
+    with pytest.raises(ValueError):
+        asyncio.run(sarvamXsupa._push_to_inventory(dict(_ROW, quantity="lots")))
+
+
+def test_non_timestamp_added_at_is_a_value_error(conn):
+    with pytest.raises(ValueError):
+        asyncio.run(sarvamXsupa._push_to_inventory(dict(_ROW, addedAt=123)))
+
+
+def test_non_object_row_is_a_value_error(conn):
+    with pytest.raises(ValueError, match="Row 1"):
+        asyncio.run(
+            sarvamXsupa._push_many_to_inventory({"rows": [dict(_ROW), ["Wheat"]]})
+        )
@@ -0,0 +1,25 @@
+"""The MCP server registers each of its routes exactly once."""
+
+import os
+import sys
+from collections import Counter
+
+from fastapi.routing import APIRoute
+
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sarvamXsupa  # noqa: E402
+
+
+def test_each_route_is_registered_once():
+    paths = Counter(
+        (r.path, tuple(sorted(r.methods)))
+        for r in sarvamXsupa.app.routes
+        if isinstance(r, APIRoute)
+    )
+    assert paths == {
+        ("/mcp", ("POST",)): 1,
+        ("/health", ("GET",)): 1,
+        ("/agent", ("POST",)): 1,
+    }